@@ -0,0 +1,113 @@
+"""Incrementally maintained chore counts for Chore Tracker."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+DOMAIN = "chore_tracker"
+DATA_COUNTERS = f"{DOMAIN}_counters"
+
+# Chore states that get a count sensor
+COUNTED_STATES = ("Upcoming", "Due today", "Due now", "Overdue")
+
+
+@callback
+def async_get_counters(
+    hass: HomeAssistant, entry_id: str | None = None
+) -> ChoreCounters:
+    """Return the counters of a hub entry, creating them on first use.
+
+    Without an entry id, return the counters of every chore.
+    """
+    counters: dict[str | None, ChoreCounters] = hass.data.setdefault(
+        DATA_COUNTERS, {}
+    )
+    if (entry_counters := counters.get(entry_id)) is None:
+        entry_counters = counters[entry_id] = ChoreCounters()
+    return entry_counters
+
+
+class ChoreCounters:
+    """Number of chores in each state, overall and per person and area.
+
+    Every chore contributes under the (state, person, area) it was last
+    counted with, so a state change moves it between counters in constant
+    time instead of recounting every chore.
+    """
+
+    def __init__(self) -> None:
+        self._by_state: Counter[str] = Counter()
+        self._by_person: dict[str, Counter[str]] = {}
+        self._by_area: dict[str, Counter[str]] = {}
+        self._keys: dict[str, tuple[str | None, str | None, str | None]] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+
+    @callback
+    def async_update(
+        self, entity_id: str, state: str | None, person: str | None, area: str | None
+    ) -> None:
+        """Count a chore under its current state, person and area."""
+        key = (state, person, area)
+        old_key = self._keys.get(entity_id)
+        if key == old_key:
+            return
+        self._keys[entity_id] = key
+        if old_key is not None:
+            self._async_apply(old_key, -1)
+        self._async_apply(key, 1)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Stop counting a chore."""
+        if (old_key := self._keys.pop(entity_id, None)) is not None:
+            self._async_apply(old_key, -1)
+
+    @callback
+    def async_add_listener(
+        self, state: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call listener whenever the counts of a state change."""
+        listeners = self._listeners.setdefault(state, [])
+        listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(listener)
+
+        return remove_listener
+
+    def count(self, state: str) -> int:
+        """Return the number of chores in a state."""
+        return self._by_state[state]
+
+    def per_person(self, state: str) -> dict[str, int]:
+        """Return the non-zero counts of a state by person entity id."""
+        return _nonzero(self._by_person, state)
+
+    def per_area(self, state: str) -> dict[str, int]:
+        """Return the non-zero counts of a state by area id."""
+        return _nonzero(self._by_area, state)
+
+    @callback
+    def _async_apply(
+        self, key: tuple[str | None, str | None, str | None], delta: int
+    ) -> None:
+        """Add delta to every counter a key contributes to."""
+        state, person, area = key
+        if state is None:
+            return
+        self._by_state[state] += delta
+        if person:
+            self._by_person.setdefault(person, Counter())[state] += delta
+        if area:
+            self._by_area.setdefault(area, Counter())[state] += delta
+        for listener in self._listeners.get(state, ()):
+            listener()
+
+
+def _nonzero(counters: dict[str, Counter[str]], state: str) -> dict[str, int]:
+    """Return the keys whose counter for a state is non-zero."""
+    return {key: count[state] for key, count in counters.items() if count[state]}
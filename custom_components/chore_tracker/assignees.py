@@ -0,0 +1,105 @@
+"""Assignee names for Chore Tracker sensors, kept current by person events."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+DATA_ASSIGNEES = f"{DOMAIN}_assignees"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_assignees(hass: HomeAssistant) -> AssigneeDirectory:
+    """Return the domain-wide assignee directory, creating it on first use."""
+    assignees = hass.data.get(DATA_ASSIGNEES)
+    if assignees is None:
+        assignees = hass.data[DATA_ASSIGNEES] = AssigneeDirectory(hass)
+    return assignees
+
+
+def _first_name(person_entity: str, state: State | None) -> str:
+    """Return the first word of a person's friendly name, or the entity id."""
+    if state is None:
+        return person_entity
+    words = str(state.attributes.get("friendly_name") or "").split()
+    return words[0] if words else person_entity
+
+
+class AssigneeDirectory:
+    """First names of the assigned persons and the chores assigned to each.
+
+    Only persons referenced by at least one chore are tracked. When one of
+    them changes, only the chores assigned to that person are refreshed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._names: dict[str, str] = {}
+        self._chores: dict[str, set[ChoreTrackerSensorEntity]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_register(
+        self, entity: ChoreTrackerSensorEntity, person_entity: str
+    ) -> None:
+        """Start tracking the person a chore is assigned to."""
+        chores = self._chores.get(person_entity)
+        if chores is None:
+            chores = self._chores[person_entity] = set()
+            self._names[person_entity] = _first_name(
+                person_entity, self._hass.states.get(person_entity)
+            )
+            self._unsubs[person_entity] = async_track_state_change_event(
+                self._hass, person_entity, self._async_person_changed
+            )
+        chores.add(entity)
+
+    @callback
+    def async_unregister(
+        self, entity: ChoreTrackerSensorEntity, person_entity: str
+    ) -> None:
+        """Stop tracking a person once no chore is assigned to them."""
+        chores = self._chores.get(person_entity)
+        if chores is None:
+            return
+        chores.discard(entity)
+        if not chores:
+            del self._chores[person_entity]
+            del self._names[person_entity]
+            self._unsubs.pop(person_entity)()
+
+    @callback
+    def async_name(self, person_entity: str) -> str:
+        """Return the cached first name of a tracked person."""
+        return self._names.get(person_entity, person_entity)
+
+    @callback
+    def _async_person_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the chores of a person whose name changed."""
+        person_entity = event.data["entity_id"]
+        name = _first_name(person_entity, event.data["new_state"])
+        if self._names.get(person_entity) == name:
+            return
+        self._names[person_entity] = name
+        chores = self._chores.get(person_entity, ())
+        _LOGGER.debug(
+            "Assignee %s renamed, refreshing %d chores", person_entity, len(chores)
+        )
+        for entity in chores:
+            entity.async_assignee_changed()
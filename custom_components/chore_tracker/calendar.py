@@ -0,0 +1,238 @@
+"""Calendar of chore occurrences for Chore Tracker."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
+
+from .clock import async_get_clock
+from .coalescer import SIGNAL_CHORES_UPDATED, SIGNAL_ENTRY_CHORES_UPDATED
+from .recurrence import RecurrenceRule
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+DATA_ENTRY_CHORES = f"{DOMAIN}_entry_chores"
+
+CONF_ENTRY_TYPE = "entry_type"
+ENTRY_TYPE_HUB = "hub"
+
+# Distinct (rule, due date, window) expansions kept in memory
+EXPANSION_CACHE_SIZE = 4096
+
+_ONE_DAY = timedelta(days=1)
+# Length of the event of a chore that is due at a time of day
+TIMED_EVENT_DURATION = timedelta(minutes=30)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar of a hub config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        async_add_entities([ChoreTrackerCalendarEntity(hass, entry)])
+        return
+    # Single chores are shown in the domain calendar; drop the calendar
+    # earlier versions created for each of them
+    registry = er.async_get(hass)
+    unique_id = f"{entry.entry_id}_calendar"
+    if entity_id := registry.async_get_entity_id("calendar", DOMAIN, unique_id):
+        registry.async_remove(entity_id)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the calendar of every single chore, loaded by the integration."""
+    if discovery_info is None:
+        return
+    async_add_entities([ChoreTrackerDomainCalendarEntity(hass)])
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _expand(
+    rule: RecurrenceRule, anchor: date, start: date, end: date
+) -> tuple[date, ...]:
+    """Return the occurrences of a series within an inclusive date window.
+
+    Chores sharing a rule and due date share the cached result, so reloading
+    the same view or showing many identical chores expands each series once.
+    """
+    return tuple(rule.occurrences(anchor, start, end))
+
+
+def _chore_event(chore: ChoreTrackerSensorEntity, day: date) -> CalendarEvent:
+    """Return the all-day event of a chore occurrence."""
+    return CalendarEvent(
+        start=day,
+        end=day + _ONE_DAY,
+        summary=chore.name,
+        uid=f"{chore.unique_id}_{day.isoformat()}",
+    )
+
+
+def _timed_event(chore: ChoreTrackerSensorEntity, start: datetime) -> CalendarEvent:
+    """Return the event of a chore occurrence due at a time of day."""
+    start = dt_util.as_local(start)
+    return CalendarEvent(
+        start=start,
+        end=start + TIMED_EVENT_DURATION,
+        summary=chore.name,
+        uid=f"{chore.unique_id}_{start.isoformat()}",
+    )
+
+
+def _local_instant(day: date, time_of_day: time) -> datetime:
+    """Return a local date and time as an aware datetime."""
+    return datetime.combine(day, time_of_day, dt_util.get_default_time_zone())
+
+
+def _event_sort_key(event: CalendarEvent) -> datetime:
+    """Order all-day and timed events on one local timeline."""
+    if isinstance(event.start, datetime):
+        return event.start
+    return dt_util.start_of_local_day(event.start)
+
+
+class _ChoreCalendarEntity(CalendarEntity):
+    """Calendar showing the upcoming occurrences of a set of chores."""
+
+    # Refreshed when this signal reports written chores
+    _signal: str
+
+    def __init__(self, hass: HomeAssistant, unique_id: str, name: str) -> None:
+        self._hass = hass
+        self._unique_id = unique_id
+        self._name = name
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the current event whenever its chores are written."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self._hass, self._signal, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def unique_id(self) -> str:
+        return self._unique_id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def should_poll(self) -> bool:
+        """Updated when chores change rather than polled."""
+        return False
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next chore occurrence from today on."""
+        today = async_get_clock(self._hass).today
+        next_due: date | None = None
+        next_chore: ChoreTrackerSensorEntity | None = None
+        for chore in self._chores():
+            due = chore.due_date
+            if due is None or due < today:
+                continue
+            if next_due is None or due < next_due:
+                next_due, next_chore = due, chore
+        if next_chore is None:
+            return None
+        if (due_at := next_chore.due_at) is not None:
+            return _timed_event(next_chore, due_at)
+        return _chore_event(next_chore, next_due)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the chore occurrences overlapping a time range."""
+        start = dt_util.as_local(start_date).date()
+        # The end of the range is exclusive
+        end = (dt_util.as_local(end_date) - timedelta(microseconds=1)).date()
+        if end < start:
+            return []
+
+        events: list[CalendarEvent] = []
+        for chore in self._chores():
+            anchor = chore.due_date
+            if anchor is None:
+                continue
+            if chore.rule.kind == "hourly":
+                events.extend(
+                    _timed_event(chore, instant)
+                    for instant in chore.rule.instants(
+                        chore.due_at, start_date, end_date - timedelta(microseconds=1)
+                    )
+                )
+            elif (due_time := chore.due_time) is not None:
+                events.extend(
+                    _timed_event(chore, _local_instant(day, due_time))
+                    for day in _expand(chore.rule, anchor, start, end)
+                )
+            else:
+                events.extend(
+                    _chore_event(chore, day)
+                    for day in _expand(chore.rule, anchor, start, end)
+                )
+        events.sort(key=_event_sort_key)
+        return events
+
+    @abstractmethod
+    def _chores(self) -> Iterable[ChoreTrackerSensorEntity]:
+        """Return the loaded chores shown in this calendar."""
+
+
+class ChoreTrackerCalendarEntity(_ChoreCalendarEntity):
+    """Calendar showing the upcoming occurrences of every chore of a hub."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        super().__init__(hass, f"{entry.entry_id}_calendar", entry.title)
+        self._entry_id = entry.entry_id
+        self._signal = SIGNAL_ENTRY_CHORES_UPDATED.format(entry.entry_id)
+
+    def _chores(self) -> Iterable[ChoreTrackerSensorEntity]:
+        """Return the loaded chores of this calendar's hub."""
+        entry_chores = self._hass.data.get(DATA_ENTRY_CHORES, {})
+        return entry_chores.get(self._entry_id, {}).values()
+
+
+class ChoreTrackerDomainCalendarEntity(_ChoreCalendarEntity):
+    """Calendar showing the occurrences of every chore that is not in a hub.
+
+    Single chores each have their own entry, so this is the one calendar
+    that shows all of them together.
+    """
+
+    _signal = SIGNAL_CHORES_UPDATED
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, f"{DOMAIN}_calendar", "Chore Tracker")
+
+    def _chores(self) -> Iterable[ChoreTrackerSensorEntity]:
+        """Return every loaded chore that has its own config entry."""
+        return [
+            chore
+            for chore in self._hass.data.get(DOMAIN, {}).values()
+            if not chore.in_hub
+        ]
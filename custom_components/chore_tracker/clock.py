@@ -0,0 +1,91 @@
+"""Shared local date for Chore Tracker computations."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+DOMAIN = "chore_tracker"
+DATA_CLOCK = f"{DOMAIN}_clock"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_clock(hass: HomeAssistant) -> LocalDateClock:
+    """Return the domain-wide local date clock, creating it on first use."""
+    clock = hass.data.get(DATA_CLOCK)
+    if clock is None:
+        clock = hass.data[DATA_CLOCK] = LocalDateClock(hass)
+    return clock
+
+
+class LocalDateClock:
+    """Today's date in Home Assistant's time zone, computed once per day.
+
+    The date advances at local midnight, either from its own timer or from
+    the transition scheduler when that fires first, so every chore handled
+    in a rollover batch sees the same day.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._today: date = date.min
+        self._next_midnight: datetime = dt_util.utcnow()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._listeners: list[Callable[[], None]] = []
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_config_updated)
+        self.async_advance(self._next_midnight)
+
+    @property
+    def today(self) -> date:
+        """Return the current local date."""
+        return self._today
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call listener whenever the local date changes."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_advance(self, now: datetime) -> None:
+        """Move to the new day once local midnight has passed."""
+        if now < self._next_midnight:
+            return
+        self._async_recompute()
+
+    @callback
+    def _async_recompute(self) -> None:
+        """Read the local date and arm the timer for the next midnight."""
+        previous = self._today
+        self._today = dt_util.now().date()
+        self._next_midnight = dt_util.start_of_local_day(
+            self._today + timedelta(days=1)
+        )
+        if self._unsub is not None:
+            self._unsub()
+        self._unsub = async_track_point_in_time(
+            self._hass, self.async_advance, self._next_midnight
+        )
+        if self._today == previous:
+            return
+        _LOGGER.debug("Local date is now %s", self._today)
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def _async_config_updated(self, event: Event) -> None:
+        """Pick up a change of the configured time zone."""
+        self._async_recompute()
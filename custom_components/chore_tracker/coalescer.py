@@ -0,0 +1,84 @@
+"""Coalesced state writes for Chore Tracker sensors."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+DATA_COALESCER = f"{DOMAIN}_coalescer"
+# Sent after a flush wrote at least one chore
+SIGNAL_CHORES_UPDATED = f"{DOMAIN}_chores_updated"
+# Sent after a flush wrote a chore of the formatted config entry id
+SIGNAL_ENTRY_CHORES_UPDATED = f"{DOMAIN}_chores_updated_{{}}"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_coalescer(hass: HomeAssistant) -> WriteCoalescer:
+    """Return the domain-wide write coalescer, creating it on first use."""
+    coalescer = hass.data.get(DATA_COALESCER)
+    if coalescer is None:
+        coalescer = hass.data[DATA_COALESCER] = WriteCoalescer(hass)
+    return coalescer
+
+
+class WriteCoalescer:
+    """Collect changed chores and write each of them once per loop iteration.
+
+    Chores marked while a flush is pending join it, so a batch service call
+    or a midnight rollover produces one flush. A chore is only written when
+    its state or attributes differ from what it last published.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # Dict rather than set to flush in the order chores were marked; the
+        # value is the config entry to signal when the entity is written
+        self._pending: dict[ChoreTrackerSensorEntity, str | None] = {}
+
+    @callback
+    def async_mark(
+        self, entity: ChoreTrackerSensorEntity, entry_id: str | None = None
+    ) -> None:
+        """Queue a chore for writing at the end of the current loop iteration.
+
+        Pass the chore's config entry id so only that entry's listeners hear
+        about the write.
+        """
+        if not self._pending:
+            self._hass.loop.call_soon(self._async_flush)
+        self._pending[entity] = entry_id
+
+    @callback
+    def async_discard(self, entity: ChoreTrackerSensorEntity) -> None:
+        """Drop a pending write, e.g. because the entity is being removed."""
+        self._pending.pop(entity, None)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write every pending chore whose visible state changed."""
+        pending = self._pending
+        self._pending = {}
+        written = 0
+        entry_ids: set[str] = set()
+        for entity, entry_id in pending.items():
+            if entity.async_write_if_changed():
+                written += 1
+                if entry_id is not None:
+                    entry_ids.add(entry_id)
+        _LOGGER.debug("Wrote %d of %d changed chores", written, len(pending))
+        if not written:
+            return
+        for entry_id in entry_ids:
+            async_dispatcher_send(
+                self._hass, SIGNAL_ENTRY_CHORES_UPDATED.format(entry_id)
+            )
+        async_dispatcher_send(self._hass, SIGNAL_CHORES_UPDATED)
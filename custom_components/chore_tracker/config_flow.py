@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import date
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import selector
 
+from .history import async_get_history
+from .store import async_get_store
+
 DOMAIN = "chore_tracker"
 
 CONF_NAME = "name"
@@ -19,259 +26,363 @@ CONF_INTERVAL = "interval"
 CONF_DAY_OF_MONTH = "day_of_month"
 CONF_MONTH = "month"
 CONF_START_DATE = "start_date"
-
-
-class ChoreTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    VERSION = 1
-
-    def __init__(self):
-        self._base_data: dict = {}
-
-    async def async_step_user(self, user_input=None):
-        """Page 1: Basic info + recurrence type."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_data = {
-                CONF_NAME: user_input[CONF_NAME],
-                CONF_ICON: user_input[CONF_ICON],
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-                CONF_RECURRENCE_TYPE: recurrence_type,
-            }
-
-            if recurrence_type == "manual":
-                # Finish immediately with manual defaults
-                data = {
-                    **self._base_data,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
+CONF_DUE_TIME = "due_time"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_ENTRY_TYPE = "entry_type"
+
+ENTRY_TYPE_HUB = "hub"
+
+RECURRENCE_TYPES = {
+    "manual": "Manual",
+    "hourly": "Every N hours",
+    "daily": "Daily",
+    "weekly": "Weekly",
+    "monthly_date": "Monthly - date of month",
+    "monthly_weekday": "Monthly - day of week",
+    "yearly": "Yearly",
+    "adaptive": "Adaptive - learn from completions",
+}
+
+
+def _chore_schema() -> vol.Schema:
+    """Schema of the first chore page: basic info + recurrence type."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME): str,
+            vol.Optional(CONF_ICON, default="mdi:broom"): selector.IconSelector(),
+            vol.Optional(CONF_PERSON_ENTITY): selector.EntitySelector(
+                {"domain": "person"}
+            ),
+            vol.Required(CONF_RECURRENCE_TYPE, default="daily"): vol.In(
+                RECURRENCE_TYPES
+            ),
+        }
+    )
+
+
+def _chore_base_data(user_input: dict) -> dict:
+    """Pick the basic chore fields out of the first page."""
+    return {
+        CONF_NAME: user_input[CONF_NAME],
+        CONF_ICON: user_input[CONF_ICON],
+        CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
+        CONF_RECURRENCE_TYPE: user_input[CONF_RECURRENCE_TYPE],
+    }
+
+
+def _manual_chore_data(base_data: dict) -> dict:
+    """Finish a manual chore with its defaults."""
+    return {
+        **base_data,
+        CONF_START_DATE: date.today().isoformat(),
+        "due_days": 9999,
+    }
+
+
+def _recurrence_schema(recurrence_type: str) -> vol.Schema:
+    """Schema of the recurrence details page for a recurrence type."""
+    schema_dict: dict = {}
+
+    if recurrence_type == "hourly":
+        schema_dict[vol.Required(CONF_INTERVAL, default=6)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "hours",
+                    "mode": "box",
+                    "translation_key": "occur_every_hours",
                 }
-                return self.async_create_entry(title=data[CONF_NAME], data=data)
+            )
+        )
 
-            # Otherwise go to recurrence details page
-            return await self.async_step_recurrence()
+    elif recurrence_type == "daily":
+        schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "days",
+                    "mode": "box",
+                    "translation_key": "occur_every_days",
+                }
+            )
+        )
 
-        schema = vol.Schema(
+    elif recurrence_type == "weekly":
+        schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "weeks",
+                    "mode": "box",
+                    "translation_key": "occur_every_weeks",
+                }
+            )
+        )
+        schema_dict[vol.Optional("weekdays", default=[])] = selector.SelectSelector(
             {
-                vol.Required(CONF_NAME): str,
-                vol.Optional(CONF_ICON, default="mdi:broom"): selector.IconSelector(),
-                vol.Optional(CONF_PERSON_ENTITY): selector.EntitySelector(
-                    {"domain": "person"}
-                ),
-                vol.Required(CONF_RECURRENCE_TYPE, default="daily"): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
+                "options": [
+                    "1_Monday",
+                    "2_Tuesday",
+                    "3_Wednesday",
+                    "4_Thursday",
+                    "5_Friday",
+                    "6_Saturday",
+                    "7_Sunday",
+                ],
+                "multiple": True,
             }
         )
-        return self.async_show_form(step_id="user", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            recurrence_type = self._base_data[CONF_RECURRENCE_TYPE]
-
-            # Convert checkboxes to lists for weekly pattern
-            if recurrence_type == "weekly" and "weekdays" in user_input:
-                # Strip numbered prefixes from weekdays
-                user_input["weekdays"] = [
-                    day.split("_", 1)[1] if "_" in day else day
-                    for day in user_input.get("weekdays", [])
-                ]
-
-            # Convert checkboxes to lists for monthly_weekday pattern
-            if recurrence_type == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                user_input["monthly_weekdays"] = monthly_weekdays
-
-                # Remove the checkbox keys
-                for key in [
-                    "monday_monthly",
-                    "tuesday_monthly",
-                    "wednesday_monthly",
-                    "thursday_monthly",
-                    "friday_monthly",
-                    "saturday_monthly",
-                    "sunday_monthly",
-                ]:
-                    user_input.pop(key, None)
-
-            data = {**self._base_data, **user_input}
-            return self.async_create_entry(title=data[CONF_NAME], data=data)
 
-        recurrence_type = self._base_data[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
+    elif recurrence_type == "monthly_date":
+        schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "months",
+                    "mode": "box",
+                    "translation_key": "occur_every_months",
+                }
             )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
+        )
+        schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "max": 31,
+                    "mode": "box",
+                    "translation_key": "day_of_month",
+                }
             )
-            schema_dict[vol.Optional("weekdays", default=[])] = selector.SelectSelector(
+        )
+
+    elif recurrence_type == "monthly_weekday":
+        # Weekday checkboxes section - "Reoccur every"
+        schema_dict[vol.Optional("monday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("tuesday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("wednesday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("thursday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("friday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("saturday_monthly", default=False)] = bool
+        schema_dict[vol.Optional("sunday_monthly", default=False)] = bool
+
+        # Week selector - "Of the"
+        schema_dict[vol.Optional("monthly_weeks", default=[])] = (
+            selector.SelectSelector(
                 {
                     "options": [
-                        "1_Monday",
-                        "2_Tuesday",
-                        "3_Wednesday",
-                        "4_Thursday",
-                        "5_Friday",
-                        "6_Saturday",
-                        "7_Sunday",
+                        "1st",
+                        "2nd",
+                        "3rd",
+                        "4th",
+                        "Last",
                     ],
                     "multiple": True,
                 }
             )
+        )
 
-        elif recurrence_type == "monthly_date":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
+        # Interval - "Occur every X months"
+        schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "months",
+                    "mode": "box",
+                    "translation_key": "occur_every_months",
+                }
             )
+        )
 
-        elif recurrence_type == "monthly_weekday":
-            # Weekday checkboxes section - "Reoccur every"
-            schema_dict[vol.Optional("monday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("tuesday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("wednesday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("thursday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("friday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("saturday_monthly", default=False)] = bool
-            schema_dict[vol.Optional("sunday_monthly", default=False)] = bool
-
-            # Week selector - "Of the"
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
+    elif recurrence_type == "yearly":
+        schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "years",
+                    "mode": "box",
+                    "translation_key": "occur_every_years",
+                }
             )
-
-            # Interval - "Occur every X months"
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
+        )
+        schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
+            {
+                "options": [
+                    "January",
+                    "February",
+                    "March",
+                    "April",
+                    "May",
+                    "June",
+                    "July",
+                    "August",
+                    "September",
+                    "October",
+                    "November",
+                    "December",
+                ],
+            }
+        )
+        schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
+            selector.NumberSelector(
+                {
+                    "min": 1,
+                    "max": 31,
+                    "mode": "box",
+                    "translation_key": "day_of_month",
+                }
             )
+        )
 
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
+    elif recurrence_type == "adaptive":
+        schema_dict[vol.Required(CONF_INTERVAL, default=7)] = (
+            selector.NumberSelector(
                 {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
+                    "min": 1,
+                    "step": 1,
+                    "unit_of_measurement": "days",
+                    "mode": "box",
+                    "translation_key": "occur_every_days",
                 }
             )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
+        )
+        schema_dict[vol.Required(CONF_MIN_INTERVAL, default=1)] = (
+            selector.NumberSelector(
+                {"min": 1, "step": 1, "unit_of_measurement": "days", "mode": "box"}
             )
+        )
+        schema_dict[vol.Required(CONF_MAX_INTERVAL, default=90)] = (
+            selector.NumberSelector(
+                {"min": 1, "step": 1, "unit_of_measurement": "days", "mode": "box"}
+            )
+        )
+
+    # Time of day the chore falls due; hourly chores start counting from it
+    schema_dict[vol.Optional(CONF_DUE_TIME)] = selector.TimeSelector()
+
+    # Always put start date last
+    schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
+        selector.DateSelector()
+    )
+
+    return vol.Schema(schema_dict)
+
+
+def _schedule(data: Mapping[str, Any]) -> dict:
+    """Return the chore settings that determine its due dates."""
+    return {
+        key: value
+        for key, value in data.items()
+        if key not in (CONF_NAME, CONF_ICON, CONF_PERSON_ENTITY)
+    }
+
+
+def _recurrence_data(recurrence_type: str, user_input: dict) -> dict:
+    """Convert the recurrence details page into stored chore data."""
+    # Convert checkboxes to lists for weekly pattern
+    if recurrence_type == "weekly" and "weekdays" in user_input:
+        # Strip numbered prefixes from weekdays
+        user_input["weekdays"] = [
+            day.split("_", 1)[1] if "_" in day else day
+            for day in user_input.get("weekdays", [])
+        ]
+
+    # Convert checkboxes to lists for monthly_weekday pattern
+    if recurrence_type == "monthly_weekday":
+        monthly_weekdays = []
+        if user_input.get("monday_monthly"):
+            monthly_weekdays.append("Monday")
+        if user_input.get("tuesday_monthly"):
+            monthly_weekdays.append("Tuesday")
+        if user_input.get("wednesday_monthly"):
+            monthly_weekdays.append("Wednesday")
+        if user_input.get("thursday_monthly"):
+            monthly_weekdays.append("Thursday")
+        if user_input.get("friday_monthly"):
+            monthly_weekdays.append("Friday")
+        if user_input.get("saturday_monthly"):
+            monthly_weekdays.append("Saturday")
+        if user_input.get("sunday_monthly"):
+            monthly_weekdays.append("Sunday")
+
+        user_input["monthly_weekdays"] = monthly_weekdays
+
+        # Remove the checkbox keys
+        for key in [
+            "monday_monthly",
+            "tuesday_monthly",
+            "wednesday_monthly",
+            "thursday_monthly",
+            "friday_monthly",
+            "saturday_monthly",
+            "sunday_monthly",
+        ]:
+            user_input.pop(key, None)
+
+    # Keep the learned interval bounds in order
+    if recurrence_type == "adaptive":
+        low, high = sorted(
+            (user_input[CONF_MIN_INTERVAL], user_input[CONF_MAX_INTERVAL])
+        )
+        user_input[CONF_MIN_INTERVAL] = low
+        user_input[CONF_MAX_INTERVAL] = high
+
+    return user_input
 
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
+
+class ChoreTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    VERSION = 1
+
+    def __init__(self):
+        self._base_data: dict = {}
+
+    async def async_step_user(self, user_input=None):
+        """Choose between a single chore and a hub of chores."""
+        return self.async_show_menu(step_id="user", menu_options=["chore", "hub"])
+
+    async def async_step_chore(self, user_input=None):
+        """Page 1: Basic info + recurrence type."""
+        if user_input is not None:
+            self._base_data = _chore_base_data(user_input)
+
+            if self._base_data[CONF_RECURRENCE_TYPE] == "manual":
+                # Finish immediately with manual defaults
+                data = _manual_chore_data(self._base_data)
+                return self.async_create_entry(title=data[CONF_NAME], data=data)
+
+            # Otherwise go to recurrence details page
+            return await self.async_step_recurrence()
+
+        return self.async_show_form(step_id="chore", data_schema=_chore_schema())
+
+    async def async_step_recurrence(self, user_input=None):
+        """Page 2: Recurrence pattern options."""
+        recurrence_type = self._base_data[CONF_RECURRENCE_TYPE]
+        if user_input is not None:
+            data = {**self._base_data, **_recurrence_data(recurrence_type, user_input)}
+            return self.async_create_entry(title=data[CONF_NAME], data=data)
+
+        return self.async_show_form(
+            step_id="recurrence", data_schema=_recurrence_schema(recurrence_type)
         )
 
+    async def async_step_hub(self, user_input=None):
+        """Create a hub that hosts many chores in a single entry."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=user_input[CONF_NAME],
+                data={CONF_ENTRY_TYPE: ENTRY_TYPE_HUB, CONF_NAME: user_input[CONF_NAME]},
+            )
+
         return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
+            step_id="hub",
+            data_schema=vol.Schema({vol.Required(CONF_NAME, default="Chores"): str}),
         )
 
     async def async_step_monthly(self, user_input=None):
@@ -363,2252 +474,145 @@ class ChoreTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry):
+        if config_entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+            return ChoreTrackerHubOptionsFlowHandler(config_entry)
         return ChoreTrackerOptionsFlowHandler(config_entry)
 
 
 class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
+    """Edit a single chore after it has been created."""
 
     def __init__(self, entry: config_entries.ConfigEntry) -> None:
         self._entry = entry
-        self._base_options: dict = {}
+        self._base_data: dict = {}
 
     async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
+        """Page 1: Basic info + recurrence type."""
         if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
+            self._base_data = _chore_base_data(user_input)
 
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
+            if self._base_data[CONF_RECURRENCE_TYPE] == "manual":
+                return self._async_update_chore(_manual_chore_data(self._base_data))
 
             return await self.async_step_recurrence()
 
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                _chore_schema(), self._entry.data
+            ),
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
 
     async def async_step_recurrence(self, user_input=None):
         """Page 2: Recurrence pattern options."""
+        recurrence_type = self._base_data[CONF_RECURRENCE_TYPE]
         if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
+            return self._async_update_chore(
+                {**self._base_data, **_recurrence_data(recurrence_type, user_input)}
             )
 
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
+        return self.async_show_form(
+            step_id="recurrence", data_schema=_recurrence_schema(recurrence_type)
+        )
 
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
+    def _async_update_chore(self, data: dict):
+        """Replace the chore definition and reload it.
 
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
+        The sensor is built from the entry data, so the edited chore is
+        stored there rather than in the entry options. A changed schedule
+        also drops the stored due date, so the chore is scheduled anew.
+        """
+        if _schedule(data) != _schedule(self._entry.data):
+            async_get_store(self.hass).async_clear_due_date(self._entry.entry_id)
+        self.hass.config_entries.async_update_entry(
+            self._entry, title=data[CONF_NAME], data=data, options={}
         )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(self._entry.entry_id)
         )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
+        return self.async_create_entry(title="", data={})
 
 
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
+class ChoreTrackerHubOptionsFlowHandler(config_entries.OptionsFlow):
+    """Add and remove the chores hosted by a hub."""
 
     def __init__(self, entry: config_entries.ConfigEntry) -> None:
         self._entry = entry
-        self._base_options: dict = {}
+        self._base_data: dict = {}
 
     async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
+        """Choose whether to add or remove a chore."""
+        return self.async_show_menu(
+            step_id="init", menu_options=["add_chore", "remove_chore"]
+        )
+
+    async def async_step_add_chore(self, user_input=None):
+        """Page 1: Basic info + recurrence type of the new chore."""
         if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
+            self._base_data = _chore_base_data(user_input)
 
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
+            if self._base_data[CONF_RECURRENCE_TYPE] == "manual":
+                return self._async_add_chore(_manual_chore_data(self._base_data))
 
             return await self.async_step_recurrence()
 
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="add_chore", data_schema=_chore_schema())
 
     async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
+        """Page 2: Recurrence pattern options of the new chore."""
+        recurrence_type = self._base_data[CONF_RECURRENCE_TYPE]
         if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
-        )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
-
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
-
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
-        )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
-
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
-
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
-        )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
-
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
-
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
-        )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
-
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
-
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
+            return self._async_add_chore(
+                {**self._base_data, **_recurrence_data(recurrence_type, user_input)}
             )
 
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
         return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
+            step_id="recurrence", data_schema=_recurrence_schema(recurrence_type)
         )
 
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
+    async def async_step_remove_chore(self, user_input=None):
+        """Remove a chore from the hub."""
+        store = async_get_store(self.hass)
+        hub_id = self._entry.entry_id
 
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
         if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
+            chore_id = user_input["chore"]
+            store.async_remove_hub_chore(hub_id, chore_id)
+            async_get_history(self.hass).async_remove([chore_id])
+            registry = er.async_get(self.hass)
+            if entity_id := registry.async_get_entity_id("sensor", DOMAIN, chore_id):
+                registry.async_remove(entity_id)
+            device_registry = dr.async_get(self.hass)
+            if device := device_registry.async_get_device({(DOMAIN, chore_id)}):
+                device_registry.async_remove_device(device.id)
+            return self._async_finish()
+
+        chores = store.async_get_hub_chores(hub_id)
+        if not chores:
+            return self.async_abort(reason="no_chores")
 
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
         schema = vol.Schema(
             {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=schema)
-
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
+                vol.Required("chore"): selector.SelectSelector(
                     {
                         "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
+                            {"value": chore_id, "label": data[CONF_NAME]}
+                            for chore_id, data in chores.items()
                         ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
                     }
                 )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
-
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
-        )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
-
-
-class ChoreTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle editing options after a chore has been created."""
-
-    def __init__(self, entry: config_entries.ConfigEntry) -> None:
-        self._entry = entry
-        self._base_options: dict = {}
-
-    async def async_step_init(self, user_input=None):
-        """Page 1: Basic options."""
-        if user_input is not None:
-            recurrence_type = user_input[CONF_RECURRENCE_TYPE]
-            self._base_options = {
-                CONF_RECURRENCE_TYPE: recurrence_type,
-                CONF_ICON: user_input.get(CONF_ICON, "mdi:broom"),
-                CONF_PERSON_ENTITY: user_input.get(CONF_PERSON_ENTITY),
-            }
-
-            if recurrence_type == "manual":
-                data = {
-                    **self._base_options,
-                    CONF_START_DATE: date.today().isoformat(),
-                    "due_days": 9999,
-                }
-                return self.async_create_entry(title="", data=data)
-
-            return await self.async_step_recurrence()
-
-        options = self._entry.options or {}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RECURRENCE_TYPE,
-                    default=options.get(CONF_RECURRENCE_TYPE, "daily"),
-                ): vol.In(
-                    {
-                        "manual": "Manual",
-                        "daily": "Daily",
-                        "weekly": "Weekly",
-                        "monthly_date": "Monthly - date of month",
-                        "monthly_weekday": "Monthly - day of week",
-                        "yearly": "Yearly",
-                    }
-                ),
-                vol.Optional(
-                    CONF_ICON, default=options.get(CONF_ICON, "mdi:broom")
-                ): selector.IconSelector(),
-                vol.Optional(
-                    CONF_PERSON_ENTITY, default=options.get(CONF_PERSON_ENTITY)
-                ): selector.EntitySelector({"domain": "person"}),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="remove_chore", data_schema=schema)
 
-    async def async_step_recurrence(self, user_input=None):
-        """Page 2: Recurrence pattern options."""
-        if user_input is not None:
-            # Convert checkbox booleans to weekdays list
-            if (
-                user_input.get(CONF_RECURRENCE_TYPE) == "weekly"
-                or self._base_options.get(CONF_RECURRENCE_TYPE) == "weekly"
-            ):
-                weekdays = []
-                if user_input.get("monday"):
-                    weekdays.append("Monday")
-                if user_input.get("tuesday"):
-                    weekdays.append("Tuesday")
-                if user_input.get("wednesday"):
-                    weekdays.append("Wednesday")
-                if user_input.get("thursday"):
-                    weekdays.append("Thursday")
-                if user_input.get("friday"):
-                    weekdays.append("Friday")
-                if user_input.get("saturday"):
-                    weekdays.append("Saturday")
-                if user_input.get("sunday"):
-                    weekdays.append("Sunday")
-
-                # Remove checkbox keys and add weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday",
-                        "tuesday",
-                        "wednesday",
-                        "thursday",
-                        "friday",
-                        "saturday",
-                        "sunday",
-                    ]
-                }
-                if weekdays:
-                    user_input["weekdays"] = weekdays
-
-            # Convert monthly_weekday checkboxes to list
-            if self._base_options.get(CONF_RECURRENCE_TYPE) == "monthly_weekday":
-                monthly_weekdays = []
-                if user_input.get("monday_monthly"):
-                    monthly_weekdays.append("Monday")
-                if user_input.get("tuesday_monthly"):
-                    monthly_weekdays.append("Tuesday")
-                if user_input.get("wednesday_monthly"):
-                    monthly_weekdays.append("Wednesday")
-                if user_input.get("thursday_monthly"):
-                    monthly_weekdays.append("Thursday")
-                if user_input.get("friday_monthly"):
-                    monthly_weekdays.append("Friday")
-                if user_input.get("saturday_monthly"):
-                    monthly_weekdays.append("Saturday")
-                if user_input.get("sunday_monthly"):
-                    monthly_weekdays.append("Sunday")
-
-                # Remove checkbox keys and add monthly_weekdays list
-                user_input = {
-                    k: v
-                    for k, v in user_input.items()
-                    if k
-                    not in [
-                        "monday_monthly",
-                        "tuesday_monthly",
-                        "wednesday_monthly",
-                        "thursday_monthly",
-                        "friday_monthly",
-                        "saturday_monthly",
-                        "sunday_monthly",
-                    ]
-                }
-                if monthly_weekdays:
-                    user_input["monthly_weekdays"] = monthly_weekdays
-
-            data = {**self._base_options, **user_input}
-            return self.async_create_entry(title="", data=data)
-
-        recurrence_type = self._base_options[CONF_RECURRENCE_TYPE]
-        schema_dict: dict = {}
-
-        if recurrence_type == "daily":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "days",
-                        "mode": "box",
-                        "translation_key": "occur_every_days",
-                    }
-                )
-            )
-
-        elif recurrence_type == "weekly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "weeks",
-                        "mode": "box",
-                        "translation_key": "occur_every_weeks",
-                    }
-                )
-            )
-            schema_dict[vol.Optional("monday", default=False)] = bool
-            schema_dict[vol.Optional("tuesday", default=False)] = bool
-            schema_dict[vol.Optional("wednesday", default=False)] = bool
-            schema_dict[vol.Optional("thursday", default=False)] = bool
-            schema_dict[vol.Optional("friday", default=False)] = bool
-            schema_dict[vol.Optional("saturday", default=False)] = bool
-            schema_dict[vol.Optional("sunday", default=False)] = bool
-
-        elif recurrence_type == "monthly":
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weekdays", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "Monday",
-                            "Tuesday",
-                            "Wednesday",
-                            "Thursday",
-                            "Friday",
-                            "Saturday",
-                            "Sunday",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Optional("monthly_weeks", default=[])] = (
-                selector.SelectSelector(
-                    {
-                        "options": [
-                            "1st",
-                            "2nd",
-                            "3rd",
-                            "4th",
-                            "Last",
-                        ],
-                        "multiple": True,
-                    }
-                )
-            )
-
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "months",
-                        "mode": "box",
-                        "translation_key": "occur_every_months",
-                    }
-                )
-            )
-
-        elif recurrence_type == "yearly":
-            schema_dict[vol.Required(CONF_INTERVAL, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "step": 1,
-                        "unit_of_measurement": "years",
-                        "mode": "box",
-                        "translation_key": "occur_every_years",
-                    }
-                )
-            )
-            schema_dict[vol.Required(CONF_MONTH, default=1)] = selector.SelectSelector(
-                {
-                    "options": [
-                        "January",
-                        "February",
-                        "March",
-                        "April",
-                        "May",
-                        "June",
-                        "July",
-                        "August",
-                        "September",
-                        "October",
-                        "November",
-                        "December",
-                    ],
-                }
-            )
-            schema_dict[vol.Required(CONF_DAY_OF_MONTH, default=1)] = (
-                selector.NumberSelector(
-                    {
-                        "min": 1,
-                        "max": 31,
-                        "mode": "box",
-                        "translation_key": "day_of_month",
-                    }
-                )
-            )
-
-        # Always put start date last
-        schema_dict[vol.Required(CONF_START_DATE, default=date.today().isoformat())] = (
-            selector.DateSelector()
-        )
+    def _async_add_chore(self, data: dict):
+        """Store the new chore and finish."""
+        async_get_store(self.hass).async_add_hub_chore(self._entry.entry_id, data)
+        return self._async_finish()
 
-        return self.async_show_form(
-            step_id="recurrence", data_schema=vol.Schema(schema_dict)
+    def _async_finish(self):
+        """Reload the hub so its sensors match the stored chores."""
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(self._entry.entry_id)
         )
-
-    @staticmethod
-    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
-        return ChoreTrackerOptionsFlowHandler(config_entry)
+        return self.async_create_entry(title="", data=dict(self._entry.options))
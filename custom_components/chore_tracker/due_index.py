@@ -0,0 +1,215 @@
+"""Sorted due-date index of Chore Tracker chores."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+DATA_DUE_INDEX = f"{DOMAIN}_due_index"
+
+_ONE_DAY = timedelta(days=1)
+
+
+@callback
+def async_get_due_index(hass: HomeAssistant) -> DueDateIndex:
+    """Return the domain-wide due-date index, creating it on first use."""
+    index = hass.data.get(DATA_DUE_INDEX)
+    if index is None:
+        index = hass.data[DATA_DUE_INDEX] = DueDateIndex(hass)
+    return index
+
+
+@callback
+def async_get_area_id(hass: HomeAssistant, entity_id: str) -> str | None:
+    """Return the area of a chore, falling back to its device's area."""
+    entry = er.async_get(hass).async_get(entity_id)
+    if entry is None:
+        return None
+    if entry.area_id:
+        return entry.area_id
+    if entry.device_id and (device := dr.async_get(hass).async_get(entry.device_id)):
+        return device.area_id
+    return None
+
+
+def _slice(
+    entries: list[tuple[date, str]], start: date | None, end: date | None
+) -> list[tuple[date, str]]:
+    """Return the entries due between start and end, both inclusive."""
+    low = 0 if start is None else bisect_left(entries, (start, ""))
+    if end is None:
+        return entries[low:]
+    return entries[low : bisect_left(entries, (end + _ONE_DAY, ""))]
+
+
+class DueDateIndex:
+    """Scheduled chores as (due date, entity_id) lists kept in sorted order.
+
+    Besides the list of all chores there is one list per assigned person and
+    one per area, so every slice is two bisections plus the matches. Chores
+    without a due date are not indexed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._all: list[tuple[date, str]] = []
+        self._by_person: dict[str, list[tuple[date, str]]] = {}
+        self._by_area: dict[str, list[tuple[date, str]]] = {}
+        # entity_id -> (due date, person, area) the chore is indexed under
+        self._keys: dict[str, tuple[date, str | None, str | None]] = {}
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+            event_filter=self._async_filter_registry_update,
+        )
+        # Chores are usually placed in an area through their device
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            event_filter=self._async_filter_device_update,
+        )
+
+    @callback
+    def async_update(self, entity: ChoreTrackerSensorEntity) -> None:
+        """Move a chore to its current position in the index."""
+        entity_id = entity.entity_id
+        due = entity.due_date
+        person = entity.person_entity
+        area = async_get_area_id(self._hass, entity_id)
+        key = (due, person, area) if due is not None else None
+        if key == self._keys.get(entity_id):
+            return
+        self._async_discard(entity_id)
+        if key is None:
+            return
+
+        item = (due, entity_id)
+        insort(self._all, item)
+        if person:
+            insort(self._by_person.setdefault(person, []), item)
+        if area:
+            insort(self._by_area.setdefault(area, []), item)
+        self._keys[entity_id] = key
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Drop a chore from the index."""
+        self._async_discard(entity_id)
+
+    @callback
+    def async_query(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        person: str | None = None,
+        area: str | None = None,
+    ) -> list[tuple[date, str]]:
+        """Return (due date, entity_id) of the chores due in a window, by date.
+
+        start and end are inclusive and either may be None for an open end.
+        """
+        if person is not None and area is not None:
+            by_person = self._by_person.get(person, [])
+            by_area = self._by_area.get(area, [])
+            # Slice the shorter list and filter it by the other key
+            if len(by_person) <= len(by_area):
+                return [
+                    item
+                    for item in _slice(by_person, start, end)
+                    if self._keys[item[1]][2] == area
+                ]
+            return [
+                item
+                for item in _slice(by_area, start, end)
+                if self._keys[item[1]][1] == person
+            ]
+        if person is not None:
+            return _slice(self._by_person.get(person, []), start, end)
+        if area is not None:
+            return _slice(self._by_area.get(area, []), start, end)
+        return _slice(self._all, start, end)
+
+    @callback
+    def _async_discard(self, entity_id: str) -> None:
+        """Remove the entries of a chore from every list it is in."""
+        key = self._keys.pop(entity_id, None)
+        if key is None:
+            return
+        due, person, area = key
+        item = (due, entity_id)
+        _remove(self._all, item)
+        if person:
+            _remove_from(self._by_person, person, item)
+        if area:
+            _remove_from(self._by_area, area, item)
+
+    @callback
+    def _async_filter_registry_update(
+        self, event_data: er.EventEntityRegistryUpdatedData
+    ) -> bool:
+        """Only react to area changes of indexed chores."""
+        return (
+            event_data["action"] == "update"
+            and "area_id" in event_data["changes"]
+            and event_data["entity_id"] in self._keys
+        )
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Re-index a chore moved to another area."""
+        entity = self._hass.data.get(DOMAIN, {}).get(event.data["entity_id"])
+        if entity is not None:
+            self.async_update(entity)
+
+    @callback
+    def _async_filter_device_update(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Only react to area changes of devices."""
+        return event_data["action"] == "update" and "area_id" in event_data["changes"]
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Re-index and recount the chores of a device moved to another area."""
+        device = dr.async_get(self._hass).async_get(event.data["device_id"])
+        if device is None or not any(
+            domain == DOMAIN for domain, _ in device.identifiers
+        ):
+            return
+        chores = self._hass.data.get(DOMAIN, {})
+        for entry in er.async_entries_for_device(
+            er.async_get(self._hass), device.id
+        ):
+            if (entity := chores.get(entry.entity_id)) is not None:
+                entity.async_area_changed()
+
+
+def _remove(entries: list[tuple[date, str]], item: tuple[date, str]) -> None:
+    """Delete an item from a sorted list."""
+    position = bisect_left(entries, item)
+    if position < len(entries) and entries[position] == item:
+        del entries[position]
+
+
+def _remove_from(
+    lists: dict[str, list[tuple[date, str]]], key: str, item: tuple[date, str]
+) -> None:
+    """Delete an item from a keyed sorted list, dropping the list once empty."""
+    entries = lists.get(key)
+    if entries is None:
+        return
+    _remove(entries, item)
+    if not entries:
+        del lists[key]
@@ -0,0 +1,55 @@
+"""Lookup tables for the 400-year Gregorian cycle.
+
+The Gregorian calendar repeats exactly every 400 years (146,097 days, a
+whole number of weeks), so the weekday of the first of every month and
+every month length fit in two 4,800-entry byte arrays.
+"""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from functools import cache
+
+CYCLE_YEARS = 400
+CYCLE_MONTHS = CYCLE_YEARS * 12
+
+# Bit index of "Last" in a week-of-month mask
+LAST_WEEK = 4
+
+# Any year divisible by 400 starts a cycle
+_CYCLE_START = 2000
+
+
+@cache
+def _tables() -> tuple[array, array]:
+    """Build (first weekday, month length) for every month of one cycle."""
+    first_weekday = array("B")
+    month_length = array("B")
+    weekday = calendar.weekday(_CYCLE_START, 1, 1)
+    for year in range(_CYCLE_START, _CYCLE_START + CYCLE_YEARS):
+        for month in range(1, 13):
+            length = calendar.monthrange(year, month)[1]
+            first_weekday.append(weekday)
+            month_length.append(length)
+            weekday = (weekday + length) % 7
+    return first_weekday, month_length
+
+
+def month_info(year: int, month: int) -> tuple[int, int]:
+    """Return (weekday of the 1st, number of days) for a month."""
+    first_weekday, month_length = _tables()
+    index = (year % CYCLE_YEARS) * 12 + month - 1
+    return first_weekday[index], month_length[index]
+
+
+def nth_weekday(year: int, month: int, weekday: int, week: int) -> int | None:
+    """Return the day of month of the nth (0-based, or LAST_WEEK) weekday."""
+    first_weekday, month_length = _tables()
+    index = (year % CYCLE_YEARS) * 12 + month - 1
+    length = month_length[index]
+    day = 1 + (weekday - first_weekday[index]) % 7
+    if week == LAST_WEEK:
+        return day + 7 * ((length - day) // 7)
+    day += 7 * week
+    return day if day <= length else None
@@ -0,0 +1,191 @@
+"""Append-only completion history of Chore Tracker chores."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import logging
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+DOMAIN = "chore_tracker"
+DATA_HISTORY = f"{DOMAIN}_history"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.history"
+# History changes are never urgent, so batch them generously
+SAVE_DELAY = 60
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_history(hass: HomeAssistant) -> CompletionHistory:
+    """Return the domain-wide completion history, creating it on first use."""
+    history = hass.data.get(DATA_HISTORY)
+    if history is None:
+        history = hass.data[DATA_HISTORY] = CompletionHistory(hass)
+    return history
+
+
+def _encode(value: int, buffer: array) -> None:
+    """Append a signed integer to a buffer as a zigzag varint."""
+    value = value << 1 if value >= 0 else (-value << 1) - 1
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decode(buffer: Iterable[int]) -> Iterator[int]:
+    """Yield the signed integers of a zigzag varint buffer."""
+    value = shift = 0
+    for byte in buffer:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        yield value >> 1 if not value & 1 else -((value + 1) >> 1)
+        value = shift = 0
+
+
+class _ChoreLog:
+    """Completion days of one chore as varint deltas between day ordinals.
+
+    The first delta is taken from ordinal 0. Chores completed on a regular
+    schedule need one byte per completion.
+    """
+
+    __slots__ = ("buffer", "last")
+
+    def __init__(self, buffer: array | None = None, last: int = 0) -> None:
+        self.buffer = buffer if buffer is not None else array("B")
+        self.last = last
+
+    def append(self, ordinal: int) -> None:
+        _encode(ordinal - self.last, self.buffer)
+        self.last = ordinal
+
+    def ordinals(self) -> Iterator[int]:
+        ordinal = 0
+        for delta in _decode(self.buffer):
+            ordinal += delta
+            yield ordinal
+
+
+class CompletionHistory:
+    """Completion days of every chore, keyed by chore id.
+
+    The file is only read the first time history is needed; completions
+    recorded before that are applied once it is loaded. Changes are written
+    back after SAVE_DELAY seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._logs: dict[str, _ChoreLog] = {}
+        self._loaded = False
+        self._load_task: asyncio.Task[None] | None = None
+        self._pending: list[Callable[[], None]] = []
+        # Stored records that failed to decode, saved back as they were
+        self._unreadable: dict[str, Any] = {}
+
+    @callback
+    def async_record(self, chore_id: str, completed_on: date) -> None:
+        """Append a completion to a chore's history."""
+        self._async_apply(lambda: self._record(chore_id, completed_on.toordinal()))
+
+    @callback
+    def async_remove(self, chore_ids: Iterable[str]) -> None:
+        """Forget the history of deleted chores."""
+        chore_ids = list(chore_ids)
+        self._async_apply(lambda: self._remove(chore_ids))
+
+    async def async_get_completions(self, chore_id: str) -> list[date]:
+        """Return every recorded completion day of a chore, oldest first."""
+        await self._async_ensure_loaded()
+        if (log := self._logs.get(chore_id)) is None:
+            return []
+        fromordinal = date.fromordinal
+        return [fromordinal(ordinal) for ordinal in log.ordinals()]
+
+    @callback
+    def _async_apply(self, change: Callable[[], None]) -> None:
+        """Apply a change now, or once the stored history is loaded."""
+        if self._loaded:
+            change()
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+        self._pending.append(change)
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+
+    async def _async_ensure_loaded(self) -> None:
+        """Read the stored history on first use."""
+        if self._loaded:
+            return
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        """Read the stored history, then apply the changes made meanwhile."""
+        try:
+            data = await self._store.async_load() or {}
+        finally:
+            # A failed read is retried on next use, keeping the queued changes
+            self._load_task = None
+        for chore_id, record in data.get("chores", {}).items():
+            try:
+                buffer = array("B", base64.b64decode(record["data"]))
+                self._logs[chore_id] = _ChoreLog(buffer, int(record["last"]))
+            except (KeyError, TypeError, ValueError, binascii.Error):
+                _LOGGER.warning(
+                    "Keeping unreadable completion history of chore %s aside",
+                    chore_id,
+                )
+                self._unreadable[chore_id] = record
+        self._unreadable.update(data.get("unreadable", {}))
+        self._loaded = True
+        _LOGGER.debug("Loaded completion history of %d chores", len(self._logs))
+
+        pending = self._pending
+        self._pending = []
+        for change in pending:
+            change()
+        if pending:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _record(self, chore_id: str, ordinal: int) -> None:
+        log = self._logs.get(chore_id)
+        if log is None:
+            log = self._logs[chore_id] = _ChoreLog()
+        log.append(ordinal)
+
+    def _remove(self, chore_ids: list[str]) -> None:
+        for chore_id in chore_ids:
+            self._logs.pop(chore_id, None)
+            self._unreadable.pop(chore_id, None)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to disk."""
+        data: dict[str, Any] = {
+            "chores": {
+                chore_id: {
+                    "last": log.last,
+                    "data": base64.b64encode(log.buffer.tobytes()).decode("ascii"),
+                }
+                for chore_id, log in self._logs.items()
+            }
+        }
+        if self._unreadable:
+            data["unreadable"] = self._unreadable
+        return data
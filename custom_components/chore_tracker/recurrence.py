@@ -0,0 +1,312 @@
+"""Compiled recurrence rules for Chore Tracker.
+
+This module has no Home Assistant dependencies so the scheduling engine can
+be exercised and benchmarked on its own.
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+
+from .gregorian import LAST_WEEK, month_info, nth_weekday
+
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+WEEK_NAMES = ("1st", "2nd", "3rd", "4th", "Last")
+MONTH_NAMES = tuple(calendar.month_name)[1:]
+
+_WEEKDAY_BITS = {name: 1 << index for index, name in enumerate(WEEKDAY_NAMES)}
+_WEEK_BITS = {name.lower(): 1 << index for index, name in enumerate(WEEK_NAMES)}
+_MONTH_NUMBERS = {name: index for index, name in enumerate(MONTH_NAMES, start=1)}
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _weekday_mask(names: list[str] | None) -> int:
+    """Fold weekday names into a Monday=bit 0 bitmask."""
+    mask = 0
+    for name in names or ():
+        mask |= _WEEKDAY_BITS.get(name, 0)
+    return mask
+
+
+def _week_mask(names: list[str] | None) -> int:
+    """Fold "1st".."4th"/"Last" names into a bitmask."""
+    mask = 0
+    for name in names or ():
+        mask |= _WEEK_BITS.get(str(name).lower(), 0)
+    return mask
+
+
+def _month_number(value: int | str | None) -> int | None:
+    """Accept a month number or the month name stored by the config flow."""
+    if not value:
+        return None
+    if isinstance(value, str) and value in _MONTH_NUMBERS:
+        return _MONTH_NUMBERS[value]
+    return int(value)
+
+
+def add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    """Return the (year, month) that lies the given number of months later."""
+    year_offset, month_index = divmod(month - 1 + months, 12)
+    return year + year_offset, month_index + 1
+
+
+class RecurrenceRule:
+    """Immutable, pre-parsed recurrence pattern of a chore."""
+
+    __slots__ = (
+        "kind",
+        "interval",
+        "day_of_month",
+        "month",
+        "weekday_mask",
+        "week_mask",
+    )
+
+    kind: str
+    interval: int
+    day_of_month: int | None
+    month: int | None
+    weekday_mask: int
+    week_mask: int
+
+    def __init__(
+        self,
+        kind: str,
+        interval: int = 1,
+        day_of_month: int | None = None,
+        month: int | None = None,
+        weekday_mask: int = 0,
+        week_mask: int = 0,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "kind", "monthly_date" if kind == "monthly" else kind)
+        init(self, "interval", interval)
+        init(self, "day_of_month", day_of_month)
+        init(self, "month", month)
+        init(self, "weekday_mask", weekday_mask)
+        init(self, "week_mask", week_mask)
+
+    @classmethod
+    def compile(
+        cls,
+        recurrence_type: str | None,
+        interval: int | float | None = 1,
+        day_of_month: int | float | None = None,
+        month: int | str | None = None,
+        weekdays: list[str] | None = None,
+        monthly_weekdays: list[str] | None = None,
+        monthly_weeks: list[str] | None = None,
+    ) -> RecurrenceRule:
+        """Build a rule from the values stored in a config entry."""
+        kind = recurrence_type or "manual"
+        weekday_mask = _weekday_mask(
+            monthly_weekdays if kind == "monthly_weekday" else weekdays
+        )
+        return cls(
+            kind,
+            interval=int(interval) if interval else 1,
+            day_of_month=int(day_of_month) if day_of_month else None,
+            month=_month_number(month),
+            weekday_mask=weekday_mask,
+            week_mask=_week_mask(monthly_weeks),
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _key(self) -> tuple:
+        return (
+            self.kind,
+            self.interval,
+            self.day_of_month,
+            self.month,
+            self.weekday_mask,
+            self.week_mask,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RecurrenceRule):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"RecurrenceRule(kind={self.kind!r}, interval={self.interval}, "
+            f"day_of_month={self.day_of_month}, month={self.month}, "
+            f"weekday_mask={self.weekday_mask:#09b}, week_mask={self.week_mask:#07b})"
+        )
+
+    def next_after(self, start: date) -> date | None:
+        """Return the occurrence that follows the given date, if any."""
+        kind = self.kind
+        interval = self.interval
+
+        # Adaptive rules are rebuilt with the learned interval in days
+        if kind == "daily" or kind == "adaptive":
+            return start + timedelta(days=interval)
+
+        if kind == "weekly":
+            mask = self.weekday_mask
+            if mask:
+                weekday = start.weekday()
+                for offset in range(1, 8):
+                    if mask >> ((weekday + offset) % 7) & 1:
+                        return start + timedelta(days=offset)
+            return start + timedelta(weeks=interval)
+
+        if kind == "monthly_date":
+            return self._monthly_date(start, 1)
+
+        if kind == "monthly_weekday":
+            if not self.weekday_mask or not self.week_mask:
+                return None
+            year, month = add_months(start.year, start.month, interval)
+            return self._first_in_month(year, month)
+
+        if kind == "yearly":
+            return self._yearly(start, 1)
+
+        return None
+
+    def first_after(self, anchor: date, after: date) -> date | None:
+        """Return the first occurrence of the series through anchor after a date.
+
+        The series starts at anchor and continues with next_after(). The
+        result is found arithmetically, so the cost does not depend on how
+        many occurrences lie between anchor and after.
+        """
+        if after < anchor:
+            return anchor
+
+        kind = self.kind
+        interval = self.interval
+
+        steps_in_days = kind in ("daily", "adaptive")
+        if steps_in_days or (kind == "weekly" and not self.weekday_mask):
+            step = interval if steps_in_days else 7 * interval
+            periods = (after - anchor).days // step + 1
+            return anchor + timedelta(days=periods * step)
+
+        if kind == "weekly":
+            # Every selected weekday is an occurrence
+            return self.next_after(after)
+
+        if kind == "monthly_date":
+            months = (after.year - anchor.year) * 12 + after.month - anchor.month
+            periods = max(1, months // interval)
+            candidate = self._monthly_date(anchor, periods)
+            if candidate <= after:
+                candidate = self._monthly_date(anchor, periods + 1)
+            return candidate
+
+        if kind == "monthly_weekday":
+            if not self.weekday_mask or not self.week_mask:
+                return None
+            months = (after.year - anchor.year) * 12 + after.month - anchor.month
+            periods = max(1, months // interval)
+            # At most one period can fall on or before after
+            for period in range(periods, periods + 3):
+                year, month = add_months(anchor.year, anchor.month, period * interval)
+                candidate = self._first_in_month(year, month)
+                if candidate is not None and candidate > after:
+                    return candidate
+            return None
+
+        if kind == "yearly":
+            periods = max(1, (after.year - anchor.year) // interval)
+            candidate = self._yearly(anchor, periods)
+            if candidate <= after:
+                candidate = self._yearly(anchor, periods + 1)
+            return candidate
+
+        return None
+
+    def occurrences(
+        self, anchor: date, start: date | None = None, end: date | None = None
+    ) -> Iterator[date]:
+        """Lazily yield the occurrences of the series through anchor.
+
+        The stream seeks straight to start, then yields every occurrence up
+        to and including end (or forever when end is None).
+        """
+        if start is None or start <= anchor:
+            current: date | None = anchor
+        else:
+            current = self.first_after(anchor, start - _ONE_DAY)
+        while current is not None and (end is None or current <= end):
+            yield current
+            current = self.first_after(anchor, current)
+
+    def first_instant_after(
+        self, anchor: datetime, after: datetime
+    ) -> datetime | None:
+        """Return the first occurrence of an hourly series after an instant.
+
+        Works like first_after() with the interval counted in hours. Pass
+        UTC datetimes so every step is exactly that many hours, DST or not.
+        """
+        if self.kind != "hourly":
+            return None
+        if after < anchor:
+            return anchor
+        step = timedelta(hours=self.interval)
+        return anchor + step * ((after - anchor) // step + 1)
+
+    def instants(
+        self, anchor: datetime, start: datetime, end: datetime
+    ) -> Iterator[datetime]:
+        """Lazily yield the occurrences of an hourly series from start to end."""
+        if self.kind != "hourly":
+            return
+        step = timedelta(hours=self.interval)
+        current = anchor
+        if start > anchor:
+            current = anchor + step * -((anchor - start) // step)
+        while current <= end:
+            yield current
+            current += step
+
+    def _monthly_date(self, anchor: date, periods: int) -> date:
+        """Return the monthly_date occurrence a number of periods after anchor."""
+        year, month = add_months(anchor.year, anchor.month, periods * self.interval)
+        day = min(self.day_of_month or anchor.day, month_info(year, month)[1])
+        return date(year, month, day)
+
+    def _yearly(self, anchor: date, periods: int) -> date:
+        """Return the yearly occurrence a number of periods after anchor."""
+        year = anchor.year + periods * self.interval
+        month = self.month or anchor.month
+        day = min(self.day_of_month or anchor.day, month_info(year, month)[1])
+        return date(year, month, day)
+
+    def _first_in_month(self, year: int, month: int) -> date | None:
+        """Return the earliest selected week/weekday combination in a month."""
+        best = 0
+        for week in range(LAST_WEEK + 1):
+            if not self.week_mask >> week & 1:
+                continue
+            for weekday in range(7):
+                if not self.weekday_mask >> weekday & 1:
+                    continue
+                day = nth_weekday(year, month, weekday, week)
+                if day is not None and (not best or day < best):
+                    best = day
+        return date(year, month, best) if best else None
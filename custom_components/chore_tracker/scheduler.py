@@ -0,0 +1,134 @@
+"""Shared transition scheduling for Chore Tracker sensors."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+from .clock import async_get_clock
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_COMPACT_RATIO = 2
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ChoreScheduler:
+    """Return the domain-wide scheduler, creating it on first use."""
+    scheduler = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = ChoreScheduler(hass)
+    return scheduler
+
+
+class ChoreScheduler:
+    """Min-heap of chore state transitions driven by a single timer.
+
+    Every chore has at most one live heap entry keyed by the instant its
+    state next changes. Rescheduling pushes a new entry and forgets the old
+    one; superseded entries are skipped when they reach the top of the heap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._heap: list[tuple[datetime, int, ChoreTrackerSensorEntity]] = []
+        self._live: dict[
+            ChoreTrackerSensorEntity, tuple[datetime, int, ChoreTrackerSensorEntity]
+        ] = {}
+        self._counter = itertools.count()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_for: datetime | None = None
+        self._firing = False
+
+    @callback
+    def async_schedule(self, entity: ChoreTrackerSensorEntity) -> None:
+        """Queue the next state transition of a chore, replacing any earlier one."""
+        self._live.pop(entity, None)
+        when = entity.next_transition()
+        if when is None:
+            self._async_maybe_compact()
+            return
+
+        item = (when, next(self._counter), entity)
+        self._live[entity] = item
+        heapq.heappush(self._heap, item)
+        self._async_maybe_compact()
+
+        if not self._firing and (self._armed_for is None or when < self._armed_for):
+            self._async_arm(when)
+
+    @callback
+    def async_remove(self, entity: ChoreTrackerSensorEntity) -> None:
+        """Stop tracking a chore entity, cancelling the timer if idle."""
+        self._live.pop(entity, None)
+        if self._live:
+            self._async_maybe_compact()
+            return
+
+        self._heap.clear()
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._armed_for = None
+
+    @callback
+    def _async_arm(self, when: datetime) -> None:
+        """Point the shared timer at the given instant."""
+        if self._unsub is not None:
+            self._unsub()
+        self._armed_for = when
+        self._unsub = async_track_point_in_time(self._hass, self._async_fire, when)
+
+    @callback
+    def _async_maybe_compact(self) -> None:
+        """Drop superseded entries when they dominate the heap."""
+        if len(self._heap) > _COMPACT_RATIO * len(self._live) + 16:
+            self._heap = list(self._live.values())
+            heapq.heapify(self._heap)
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Pop every chore whose transition is due and queue its state write."""
+        self._unsub = None
+        self._armed_for = None
+        # Day-based transitions fire at local midnight; make sure chores see the new day
+        async_get_clock(self._hass).async_advance(now)
+
+        heap = self._heap
+        live = self._live
+        due: list[ChoreTrackerSensorEntity] = []
+        while heap and heap[0][0] <= now:
+            item = heapq.heappop(heap)
+            entity = item[2]
+            if live.get(entity) is item:
+                del live[entity]
+                due.append(entity)
+
+        self._firing = True
+        try:
+            for entity in due:
+                entity.async_rollover()
+                self.async_schedule(entity)
+        finally:
+            self._firing = False
+
+        _LOGGER.debug("Processed %d chore transitions", len(due))
+
+        heap = self._heap
+        while heap and live.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)
+        if heap:
+            self._async_arm(heap[0][0])
@@ -1,11 +1,36 @@
 from __future__ import annotations
-from datetime import datetime, timedelta, date
-from homeassistant.components.sensor import SensorEntity, RestoreEntity
-from homeassistant.core import HomeAssistant
+from collections.abc import Mapping
+from datetime import datetime, time, timedelta, date
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+from homeassistant.components.sensor import (
+    RestoreEntity,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
+
+from .aggregates import COUNTED_STATES, ChoreCounters, async_get_counters
+from .assignees import async_get_assignees
+from .clock import async_get_clock
+from .coalescer import async_get_coalescer
+from .due_index import async_get_area_id, async_get_due_index
+from .history import async_get_history
+from .recurrence import RecurrenceRule
+from .scheduler import async_get_scheduler
+from .stats import ChoreStats
+from .store import async_get_store
+from .triggers import async_get_trigger_index
 
 DOMAIN = "chore_tracker"
+DATA_ENTRY_CHORES = f"{DOMAIN}_entry_chores"
 
 # Constants (make sure these match your config_flow.py)
 CONF_NAME = "name"
@@ -16,6 +41,12 @@ CONF_DAY_OF_MONTH = "day_of_month"
 CONF_MONTH = "month"
 CONF_START_DATE = "start_date"
 CONF_PERSON_ENTITY = "person_entity"
+CONF_DUE_TIME = "due_time"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_ENTRY_TYPE = "entry_type"
+
+ENTRY_TYPE_HUB = "hub"
 
 
 async def async_setup_entry(
@@ -23,12 +54,58 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Chore Tracker sensor from a config entry."""
-    data = entry.data
-    entity = ChoreTrackerSensorEntity(
+    """Set up Chore Tracker sensors from a chore or hub config entry."""
+    store = async_get_store(hass)
+    counts: list[ChoreTrackerCountSensorEntity] = []
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        entities = [
+            _create_chore_entity(hass, entry, chore_id, data)
+            for chore_id, data in store.async_get_hub_chores(entry.entry_id).items()
+        ]
+        counters = async_get_counters(hass, entry.entry_id)
+        counts = [
+            ChoreTrackerCountSensorEntity(
+                hass, counters, state, entry.entry_id, entry.title
+            )
+            for state in COUNTED_STATES
+        ]
+    else:
+        entities = [_create_chore_entity(hass, entry, entry.entry_id, entry.data)]
+    days = [ChoreTrackerDaysUntilDueSensorEntity(hass, entity) for entity in entities]
+
+    for entity in entities:
+        if not entity.restore_record(store.async_get(entity.unique_id)):
+            entity.prime_due_date()
+
+    async_add_entities([*entities, *days, *counts])
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the count sensors of every chore, loaded by the integration."""
+    if discovery_info is None:
+        return
+    counters = async_get_counters(hass)
+    async_add_entities(
+        [
+            ChoreTrackerCountSensorEntity(hass, counters, state, DOMAIN, "All chores")
+            for state in COUNTED_STATES
+        ]
+    )
+
+
+def _create_chore_entity(
+    hass: HomeAssistant, entry: ConfigEntry, unique_id: str, data: Mapping[str, Any]
+) -> ChoreTrackerSensorEntity:
+    """Build the sensor of one chore from its stored definition."""
+    return ChoreTrackerSensorEntity(
         hass=hass,
         entry=entry,
-        unique_id=entry.entry_id,
+        unique_id=unique_id,
         name=data.get(CONF_NAME),
         recurrence_type=data.get(CONF_RECURRENCE_TYPE),
         interval=data.get(CONF_INTERVAL, 1),
@@ -40,18 +117,66 @@ async def async_setup_entry(
         weekdays=data.get("weekdays"),
         monthly_weekdays=data.get("monthly_weekdays"),
         monthly_weeks=data.get("monthly_weeks"),
+        min_interval=data.get(CONF_MIN_INTERVAL),
+        max_interval=data.get(CONF_MAX_INTERVAL),
+        due_time=data.get(CONF_DUE_TIME),
     )
 
-    # Register entity in hass.data for service access
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entity.entity_id] = entity
 
-    async_add_entities([entity])
+@cache
+def _static_attributes(
+    recurrence_type: str | None,
+    interval: int,
+    weekdays: tuple[str, ...] | None,
+    day_of_month: int | None,
+    month: int | None,
+    monthly_weekdays: tuple[str, ...] | None,
+    monthly_weeks: tuple[str, ...] | None,
+    due_time: str | None,
+) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Return the read-only attributes placed before and after last_completed_date.
+
+    Chores with the same recurrence settings share one pair of mappings.
+    """
+    head = {"recurrence_type": recurrence_type, "interval": interval}
+    tail: dict[str, Any] = {}
+    if weekdays:
+        tail["weekdays"] = weekdays
+    if day_of_month:
+        tail["day_of_month"] = day_of_month
+    if month:
+        tail["month"] = month
+    if monthly_weekdays:
+        tail["monthly_weekdays"] = monthly_weekdays
+    if monthly_weeks:
+        tail["monthly_weeks"] = monthly_weeks
+    if due_time:
+        tail["due_time"] = due_time
+    return MappingProxyType(head), MappingProxyType(tail)
+
+
+def _as_tuple(values: list[str] | None) -> tuple[str, ...] | None:
+    """Make a stored list hashable for the static attribute cache."""
+    return tuple(values) if values else None
 
 
 class ChoreTrackerSensorEntity(RestoreEntity, SensorEntity):
     """Sensor entity representing a chore recurrence."""
 
+    # Settings change only through reconfiguration
+    _unrecorded_attributes = frozenset(
+        {
+            "recurrence_type",
+            "interval",
+            "weekdays",
+            "day_of_month",
+            "month",
+            "monthly_weekdays",
+            "monthly_weeks",
+            "due_time",
+        }
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -68,51 +193,167 @@ class ChoreTrackerSensorEntity(RestoreEntity, SensorEntity):
         weekdays: list[str] | None = None,
         monthly_weekdays: list[str] | None = None,
         monthly_weeks: list[str] | None = None,
+        min_interval: int | None = None,
+        max_interval: int | None = None,
+        due_time: str | None = None,
     ):
         self._hass = hass
+        self._clock = async_get_clock(hass)
         self._entry = entry
+        # Every chore is counted domain-wide, hub chores also per hub
+        self._counters = [async_get_counters(hass)]
+        if self.in_hub:
+            self._counters.append(async_get_counters(hass, entry.entry_id))
         self._unique_id = unique_id
         self._name = name
-        self._recurrence_type = recurrence_type
-        self._interval = int(interval) if interval else 1
-        self._day_of_month = int(day_of_month) if day_of_month else None
-        self._month = int(month) if month else None
+        self._rule = RecurrenceRule.compile(
+            recurrence_type,
+            interval=interval,
+            day_of_month=day_of_month,
+            month=month,
+            weekdays=weekdays,
+            monthly_weekdays=monthly_weekdays,
+            monthly_weeks=monthly_weeks,
+        )
         self._start_date = start_date
         self._icon = icon
         self._person_entity = person_entity
-        self._weekdays = weekdays
-        self._monthly_weekdays = monthly_weekdays
-        self._monthly_weeks = monthly_weeks
+        # Bounds of the interval an adaptive chore may learn
+        self._min_interval = int(min_interval) if min_interval else 1
+        self._max_interval = int(max_interval) if max_interval else None
+        # Chores with a time of day, and hourly chores, are due at an instant
+        self._due_time = time.fromisoformat(due_time) if due_time else None
+        self._timed = self._due_time is not None or self._rule.kind == "hourly"
+        self._static_head, self._static_tail = _static_attributes(
+            recurrence_type,
+            self._rule.interval,
+            _as_tuple(weekdays),
+            self._rule.day_of_month,
+            self._rule.month,
+            _as_tuple(monthly_weekdays),
+            _as_tuple(monthly_weeks),
+            self._due_time.isoformat() if self._due_time else None,
+        )
+        # Attributes are rebuilt only when anything in this key changes
+        self._attributes_key: tuple | None = None
+        self._attributes: dict[str, Any] = {}
         self._last_completed_date: date | None = None
-
-        # Calculate first due date
-        self._due_date: datetime | None = self._calculate_next_due(self._start_date)
+        self._due_date_overridden = False
+        self._stats = ChoreStats()
+        self._restored = False
+        # (state, attributes) as last written to Home Assistant
+        self._published: tuple[str | None, dict] | None = None
+        # Set by async_setup_entry so due date changes also update it
+        self.days_until_due_sensor: ChoreTrackerDaysUntilDueSensorEntity | None = None
+        # (completion date, previous due date) to announce with the next write
+        self._completion: tuple[date, date | None] | None = None
+
+        # First due date is filled in by restore_record or prime_due_date
+        self._due_date: datetime | None = None
+
+    def prime_due_date(self) -> None:
+        """Set the first due date from the start date."""
+        if self._rule.kind == "hourly":
+            anchor = self._as_utc(datetime.combine(self._start_date, self._time_of_day))
+            self._due_date = self._as_local(
+                self._rule.first_instant_after(anchor, anchor)
+            )
+        else:
+            self._due_date = self._calculate_next_due(self._start_date)
+
+    def restore_record(self, record: dict | None) -> bool:
+        """Load due date and completion from the chore store.
+
+        Return whether a due date was restored; without one the chore is
+        scheduled from its start date like a new chore.
+        """
+        if record is None:
+            return False
+        try:
+            due_date = record.get("due_date")
+            last_completed_date = record.get("last_completed_date")
+            self._due_date = datetime.fromisoformat(due_date) if due_date else None
+            self._last_completed_date = (
+                datetime.fromisoformat(last_completed_date).date()
+                if last_completed_date
+                else None
+            )
+        except (ValueError, TypeError):
+            return False
+        self._due_date_overridden = bool(record.get("due_date_overridden"))
+        try:
+            self._stats = ChoreStats.from_dict(record.get("stats"))
+        except (ValueError, TypeError):
+            self._stats = ChoreStats()
+        self._adapt_rule()
+        self._restored = True
+        return self._due_date is not None
 
     async def async_added_to_hass(self) -> None:
         """Restore last completed date when entity is added."""
         await super().async_added_to_hass()
 
-        # Restore previous state
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.attributes.get("last_completed_date"):
-            try:
-                self._last_completed_date = datetime.fromisoformat(
-                    last_state.attributes["last_completed_date"]
-                ).date()
-            except (ValueError, TypeError):
-                self._last_completed_date = None
-
-        # Register in hass.data
+        if not self._restored:
+            # Not in the chore store yet; carry over what an older version saved
+            last_state = await self.async_get_last_state()
+            if last_state and last_state.attributes.get("last_completed_date"):
+                try:
+                    self._last_completed_date = datetime.fromisoformat(
+                        last_state.attributes["last_completed_date"]
+                    ).date()
+                except (ValueError, TypeError):
+                    self._last_completed_date = None
+            self._async_save()
+
+        # Register in hass.data, by entity id and by config entry
         self._hass.data.setdefault(DOMAIN, {})
         self._hass.data[DOMAIN][self.entity_id] = self
+        self._hass.data.setdefault(DATA_ENTRY_CHORES, {}).setdefault(
+            self._entry.entry_id, {}
+        )[self.entity_id] = self
+        if self._person_entity:
+            async_get_assignees(self._hass).async_register(self, self._person_entity)
+        async_get_due_index(self._hass).async_update(self)
+
+        # The platform writes the initial state right after this returns
+        self._published = (self.state, self.extra_state_attributes)
+        self._async_count()
+        async_get_scheduler(self._hass).async_schedule(self)
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
         await super().async_will_remove_from_hass()
 
+        async_get_scheduler(self._hass).async_remove(self)
+        async_get_coalescer(self._hass).async_discard(self)
+        async_get_due_index(self._hass).async_remove(self.entity_id)
+        for counters in self._counters:
+            counters.async_remove(self.entity_id)
+        if self._person_entity:
+            async_get_assignees(self._hass).async_unregister(
+                self, self._person_entity
+            )
+
         # Unregister from hass.data
         if self.entity_id in self._hass.data.get(DOMAIN, {}):
             self._hass.data[DOMAIN].pop(self.entity_id)
+        entry_chores = self._hass.data.get(DATA_ENTRY_CHORES, {})
+        if (chores := entry_chores.get(self._entry.entry_id)) is not None:
+            chores.pop(self.entity_id, None)
+            if not chores:
+                del entry_chores[self._entry.entry_id]
+
+    @callback
+    def async_registry_entry_updated(self) -> None:
+        """Recount the chore in case it moved to another area."""
+        super().async_registry_entry_updated()
+        self._async_count()
+
+    @callback
+    def async_area_changed(self) -> None:
+        """Re-index and recount the chore after its device changed area."""
+        async_get_due_index(self._hass).async_update(self)
+        self._async_count()
 
     @property
     def unique_id(self) -> str:
@@ -126,12 +367,65 @@ class ChoreTrackerSensorEntity(RestoreEntity, SensorEntity):
     def icon(self) -> str | None:
         return self._icon
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Give every chore a device so automations can use device triggers."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._unique_id)},
+            name=self._name,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def in_hub(self) -> bool:
+        """Return whether the chore is hosted by a hub entry."""
+        return self._entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB
+
+    @property
+    def rule(self) -> RecurrenceRule:
+        """Return the compiled recurrence rule."""
+        return self._rule
+
+    @property
+    def due_date(self) -> date | None:
+        """Return the current due date."""
+        return self._due_date.date() if self._due_date else None
+
+    @property
+    def person_entity(self) -> str | None:
+        """Return the person the chore is assigned to."""
+        return self._person_entity
+
+    @property
+    def due_time(self) -> time | None:
+        """Return the time of day the chore falls due, if it has one."""
+        return self._due_time
+
+    @property
+    def due_at(self) -> datetime | None:
+        """Return the instant a timed chore falls due, in UTC."""
+        if self._due_date is None or not self._timed:
+            return None
+        return self._as_utc(self._due_date)
+
+    @property
+    def should_poll(self) -> bool:
+        """State only changes at scheduled transitions or on a service call."""
+        return False
+
     @property
     def state(self) -> str | None:
         """Return the chore status as the sensor state."""
         if self._due_date is None:
             return "Unscheduled"
-        days = (self._due_date.date() - date.today()).days
+        if self._timed:
+            now = dt_util.utcnow()
+            if now < self._as_utc(self._due_date):
+                return "Upcoming"
+            if now < self._overdue_at():
+                return "Due now"
+            return "Overdue"
+        days = (self._due_date.date() - self._clock.today).days
         if days > 0:
             return "Upcoming"
         elif days == 0:
@@ -142,244 +436,402 @@ class ChoreTrackerSensorEntity(RestoreEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Expose chore details as attributes."""
-        # Calculate days for "Days until due" (unclamped)
-        days_until_due = None
-        if self._due_date is not None:
-            days_until_due = (self._due_date.date() - date.today()).days
-
-        # Get assigned person's first name
-        assigned_to = None
-        if self._person_entity:
-            person_state = self.hass.states.get(self._person_entity)
-            if person_state and person_state.attributes.get("friendly_name"):
-                full_name = person_state.attributes["friendly_name"]
-                assigned_to = full_name.split()[0] if full_name else self._person_entity
-            else:
-                assigned_to = self._person_entity  # Fallback to entity ID
-
-        # Build attributes dict in the requested order
+        assigned_to = (
+            async_get_assignees(self._hass).async_name(self._person_entity)
+            if self._person_entity
+            else None
+        )
+        key = (
+            self._due_date,
+            self._last_completed_date,
+            self._stats.count,
+            assigned_to,
+        )
+        if key != self._attributes_key:
+            self._attributes_key = key
+            self._attributes = self._build_attributes(assigned_to)
+        return self._attributes
+
+    def _build_attributes(self, assigned_to: str | None) -> dict:
+        """Build the attribute dict around the shared static attributes."""
+        # Days until due is published by its own sensor, so the attributes
+        # only change on completion, rescheduling or reassignment
         attrs = {
             "chore_due_date": self._due_date.date().isoformat()
             if self._due_date
             else None,
-            "days_until_due": days_until_due,
         }
+        if self._timed and self._due_date is not None:
+            attrs["chore_due_at"] = self._as_utc(self._due_date).isoformat()
         if assigned_to:
             attrs["assigned_to"] = assigned_to
-        attrs.update(
-            {
-                "recurrence_type": self._recurrence_type,
-                "interval": self._interval,
-                "last_completed_date": self._last_completed_date.isoformat()
-                if self._last_completed_date
-                else None,
-            }
+        attrs.update(self._static_head)
+        attrs["last_completed_date"] = (
+            self._last_completed_date.isoformat() if self._last_completed_date else None
         )
-        # Add conditional attributes at the end
-        if self._weekdays:
-            attrs["weekdays"] = self._weekdays
-        if self._day_of_month:
-            attrs["day_of_month"] = self._day_of_month
-        if self._month:
-            attrs["month"] = self._month
-        if self._monthly_weekdays:
-            attrs["monthly_weekdays"] = self._monthly_weekdays
-        if self._monthly_weeks:
-            attrs["monthly_weeks"] = self._monthly_weeks
+        # Conditional attributes go at the end
+        attrs.update(self._static_tail)
+        if self._rule.kind == "adaptive":
+            attrs["learned_interval"] = self._rule.interval
+        attrs.update(self._stats.attributes())
         return attrs
 
     async def async_complete(self) -> None:
         """Mark chore as completed and calculate next due date."""
-        # Set last completed date to today
-        self._last_completed_date = date.today()
+        self.apply_complete(self._clock.today)
+        self.async_publish_change()
+
+    async def async_set_due_date(self, new_due_date: date) -> None:
+        """Set a custom due date for the chore."""
+        self.apply_due_date(new_due_date)
+        self.async_publish_change()
 
-        # Calculate next due date from current due date (or today if overdue)
-        if self._due_date:
-            # Use the current due date as the base for calculation
+    @callback
+    def apply_complete(self, today: date) -> None:
+        """Record a completion without writing state."""
+        previous_due = self._due_date.date() if self._due_date else None
+        # Set last completed date to today
+        self._last_completed_date = today
+        self._stats.record(today, previous_due)
+
+        if self._rule.kind == "hourly":
+            # Skip every occurrence already missed so the chore lands after now
+            now = dt_util.utcnow()
+            if self._due_date:
+                due = self._as_utc(self._due_date)
+                next_due = self._rule.first_instant_after(due, max(due, now))
+            else:
+                next_due = self._rule.first_instant_after(now, now)
+            self._due_date = self._as_local(next_due)
+        elif self._rule.kind == "adaptive":
+            # Next due date follows the learned interval from today
+            self._adapt_rule()
+            self._due_date = self._calculate_next_due(today)
+        # Calculate next due date from current due date (or today if unscheduled)
+        elif self._due_date:
+            # Skip every occurrence already missed so the chore lands after today
             base_date = self._due_date.date()
+            self._due_date = self._calculate_next_due(base_date, max(base_date, today))
         else:
-            base_date = date.today()
+            self._due_date = self._calculate_next_due(today)
+        self._due_date_overridden = False
+        self._completion = (today, previous_due)
+        self._async_save()
+        async_get_history(self._hass).async_record(self._unique_id, today)
+        async_get_due_index(self._hass).async_update(self)
+
+    @callback
+    def apply_due_date(self, new_due_date: date) -> None:
+        """Override the due date without writing state."""
+        # Convert date to datetime
+        self._due_date = datetime.combine(new_due_date, self._time_of_day)
+        self._due_date_overridden = True
+        self._async_save()
+        async_get_due_index(self._hass).async_update(self)
+
+    @callback
+    def async_publish_change(self) -> None:
+        """Queue a state write after a change and reschedule the next transition."""
+        coalescer = async_get_coalescer(self._hass)
+        coalescer.async_mark(self, self._entry.entry_id)
+        if self.days_until_due_sensor is not None:
+            coalescer.async_mark(self.days_until_due_sensor)
+        async_get_scheduler(self._hass).async_schedule(self)
+
+    def next_transition(self) -> datetime | None:
+        """Return the instant the state next changes on its own."""
+        if self._due_date is None:
+            return None
+        if self._timed:
+            now = dt_util.utcnow()
+            due_at = self._as_utc(self._due_date)
+            if now < due_at:
+                # Upcoming -> Due now
+                return due_at
+            overdue_at = self._overdue_at()
+            if now < overdue_at:
+                # Due now -> Overdue
+                return overdue_at
+            return None
+        due = self._due_date.date()
+        today = self._clock.today
+        if today < due:
+            # Upcoming -> Due today
+            return dt_util.start_of_local_day(due)
+        if today == due:
+            # Due today -> Overdue
+            return dt_util.start_of_local_day(due + timedelta(days=1))
+        return None
 
-        # Calculate next occurrence
-        self._due_date = self._calculate_next_due(base_date)
+    @callback
+    def async_assignee_changed(self) -> None:
+        """Queue a state write after the assigned person was renamed."""
+        async_get_coalescer(self._hass).async_mark(self, self._entry.entry_id)
+
+    @callback
+    def async_rollover(self) -> None:
+        """Queue a state write for a scheduled transition."""
+        async_get_coalescer(self._hass).async_mark(self, self._entry.entry_id)
+
+    @callback
+    def async_write_if_changed(self) -> bool:
+        """Write the state only if it differs from what was last published."""
+        published = (self.state, self.extra_state_attributes)
+        previous = self._published
+        changed = published != previous
+        if changed:
+            self._published = published
+            self.async_write_ha_state()
+            if previous is None or published[0] != previous[0]:
+                self._async_count()
+            if previous is not None and published[0] != previous[0]:
+                self._async_fire_transition(previous[0])
+        if self._completion is not None:
+            self._async_fire_completed()
+        return changed
+
+    @callback
+    def _async_fire_transition(self, previous_state: str | None) -> None:
+        """Announce the state the chore just entered."""
+        async_get_trigger_index(self._hass).async_transition(
+            self._unique_id,
+            {
+                "entity_id": self.entity_id,
+                "from_state": previous_state,
+                "to_state": self._published[0],
+                "due_date": self._due_date.date().isoformat()
+                if self._due_date
+                else None,
+            },
+        )
 
-        # Update Home Assistant state
-        self.async_write_ha_state()
+    @callback
+    def _async_fire_completed(self) -> None:
+        """Announce a completion once its state is written."""
+        completed_on, previous_due = self._completion
+        self._completion = None
+        async_get_trigger_index(self._hass).async_completed(
+            self._unique_id,
+            {
+                "entity_id": self.entity_id,
+                "completed_on": completed_on.isoformat(),
+                "previous_due_date": previous_due.isoformat()
+                if previous_due
+                else None,
+                "next_due_date": self._due_date.date().isoformat()
+                if self._due_date
+                else None,
+                "assigned_to": self._person_entity,
+            },
+        )
 
-    async def async_set_due_date(self, new_due_date: date) -> None:
-        """Set a custom due date for the chore."""
-        # Convert date to datetime
-        self._due_date = datetime.combine(new_due_date, datetime.min.time())
+    @callback
+    def _async_count(self) -> None:
+        """Move the chore to the counters of its published state."""
+        state = self._published[0] if self._published else None
+        area = async_get_area_id(self._hass, self.entity_id)
+        for counters in self._counters:
+            counters.async_update(self.entity_id, state, self._person_entity, area)
+
+    @callback
+    def _async_save(self) -> None:
+        """Persist due date, completion and override to the chore store."""
+        async_get_store(self._hass).async_update(
+            self._unique_id,
+            self._due_date,
+            self._last_completed_date,
+            self._due_date_overridden,
+            self._stats.as_dict(),
+        )
 
-        # Update Home Assistant state
-        self.async_write_ha_state()
+    @property
+    def _time_of_day(self) -> time:
+        """Return the time of day due dates fall on."""
+        return self._due_time or datetime.min.time()
+
+    @staticmethod
+    def _as_utc(local: datetime) -> datetime:
+        """Convert a naive local due date to an aware UTC instant."""
+        return dt_util.as_utc(local.replace(tzinfo=dt_util.get_default_time_zone()))
+
+    @staticmethod
+    def _as_local(instant: datetime | None) -> datetime | None:
+        """Convert an aware instant to a naive local due date."""
+        if instant is None:
+            return None
+        return dt_util.as_local(instant).replace(tzinfo=None)
+
+    def _overdue_at(self) -> datetime:
+        """Return the instant a timed chore turns from Due now to Overdue.
+
+        Hourly chores are overdue once the next occurrence would be due,
+        other chores at the end of their due day.
+        """
+        if self._rule.kind == "hourly":
+            return self._as_utc(self._due_date) + timedelta(hours=self._rule.interval)
+        return dt_util.as_utc(
+            dt_util.start_of_local_day(self._due_date.date() + timedelta(days=1))
+        )
 
-    def _calculate_next_due(self, start_date: date) -> datetime | None:
-        """Calculate the next due date based on recurrence type and interval."""
-        recurrence_type = self._recurrence_type
-        interval = int(self._interval) if self._interval else 1
-
-        year = int(start_date.year)
-        month = int(start_date.month)
-        day = int(start_date.day)
-
-        if recurrence_type == "daily":
-            return datetime(year, month, day) + timedelta(days=interval)
-
-        elif recurrence_type == "weekly":
-            if self._weekdays:
-                weekday_map = {
-                    "Monday": 0,
-                    "Tuesday": 1,
-                    "Wednesday": 2,
-                    "Thursday": 3,
-                    "Friday": 4,
-                    "Saturday": 5,
-                    "Sunday": 6,
-                }
-                selected_days = [
-                    weekday_map[day] for day in self._weekdays if day in weekday_map
-                ]
-                if selected_days:
-                    current_weekday = start_date.weekday()
-                    # Find next occurrence (skip today, start from tomorrow)
-                    for offset in range(1, 8):
-                        check_weekday = (current_weekday + offset) % 7
-                        if check_weekday in selected_days:
-                            return datetime.combine(
-                                start_date + timedelta(days=offset), datetime.min.time()
-                            )
-            # Fall back to simple weekly
-            return datetime(year, month, day) + timedelta(weeks=interval)
-
-        elif recurrence_type in ("monthly", "monthly_date"):
-            # Day-of-month pattern
-            new_month = month + interval
-            new_year = year
-            while new_month > 12:
-                new_month -= 12
-                new_year += 1
-
-            max_day = [
-                31,
-                29 if new_year % 4 == 0 else 28,
-                31,
-                30,
-                31,
-                30,
-                31,
-                31,
-                30,
-                31,
-                30,
-                31,
-            ][new_month - 1]
-            new_day = min(int(self._day_of_month or day), max_day)
-
-            return datetime(new_year, new_month, new_day)
-
-        elif recurrence_type == "monthly_weekday":
-            # Weekday-of-month pattern (e.g., 2nd Monday)
-            if self._monthly_weekdays and self._monthly_weeks:
-                return self._calculate_monthly_weekday(start_date, interval)
+    def _adapt_rule(self) -> None:
+        """Step an adaptive chore by the smoothed interval between completions."""
+        if self._rule.kind != "adaptive" or self._stats.interval_ewma is None:
+            return
+        interval = max(self._min_interval, round(self._stats.interval_ewma))
+        if self._max_interval is not None:
+            interval = min(interval, self._max_interval)
+        if interval != self._rule.interval:
+            self._rule = RecurrenceRule("adaptive", interval=interval)
+
+    def _calculate_next_due(
+        self, start_date: date, after: date | None = None
+    ) -> datetime | None:
+        """Calculate the next due date based on recurrence type and interval.
+
+        With after given, return the first occurrence of the series through
+        start_date that falls after that date instead of the one directly
+        following start_date.
+        """
+        if after is None:
+            next_due = self._rule.next_after(start_date)
+        else:
+            next_due = self._rule.first_after(start_date, after)
+        if next_due is None:
             return None
+        return datetime.combine(next_due, self._time_of_day)
 
-        elif recurrence_type == "yearly":
-            new_year = year + interval
-            new_month = int(self._month or month)
-            new_day = int(self._day_of_month or day)
-
-            max_day = [
-                31,
-                29 if new_year % 4 == 0 else 28,
-                31,
-                30,
-                31,
-                30,
-                31,
-                31,
-                30,
-                31,
-                30,
-                31,
-            ][new_month - 1]
-            new_day = min(new_day, max_day)
-
-            return datetime(new_year, new_month, new_day)
 
-        return None
+class ChoreTrackerDaysUntilDueSensorEntity(SensorEntity):
+    """Days until a chore is due, negative once it is overdue."""
 
-    def _calculate_monthly_weekday(
-        self, start_date: date, interval: int
-    ) -> datetime | None:
-        """Calculate next due date for monthly weekday pattern (e.g., 2nd Monday)."""
-        weekday_map = {
-            "Monday": 0,
-            "Tuesday": 1,
-            "Wednesday": 2,
-            "Thursday": 3,
-            "Friday": 4,
-            "Saturday": 5,
-            "Sunday": 6,
-        }
-        week_map = {"1st": 1, "2nd": 2, "3rd": 3, "4th": 4, "Last": 5}
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_icon = "mdi:calendar-clock"
 
-        # Get selected weekdays and weeks
-        selected_weekdays = [
-            weekday_map[day] for day in self._monthly_weekdays if day in weekday_map
-        ]
-        selected_weeks = [
-            week_map.get(week, week_map.get(week.lower()))
-            for week in self._monthly_weeks
-            if week in week_map or week.lower() in week_map
-        ]
-        selected_weeks = [w for w in selected_weeks if w is not None]
+    def __init__(self, hass: HomeAssistant, chore: ChoreTrackerSensorEntity) -> None:
+        self._hass = hass
+        self._clock = async_get_clock(hass)
+        self._chore = chore
+        chore.days_until_due_sensor = self
+        self._unique_id = f"{chore.unique_id}_days_until_due"
+        self._name = f"{chore.name} days until due"
+        # Wrapped in a tuple because None is a valid value
+        self._published: tuple[int | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the local date."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._clock.async_add_listener(self._async_changed))
+        self._published = (self.native_value,)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending write."""
+        await super().async_will_remove_from_hass()
+        async_get_coalescer(self._hass).async_discard(self)
+
+    @property
+    def unique_id(self) -> str:
+        return self._unique_id
 
-        if not selected_weekdays or not selected_weeks:
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Attach the sensor to its chore's device."""
+        return self._chore.device_info
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the days until the chore is due."""
+        due = self._chore.due_date
+        if due is None:
             return None
+        return (due - self._clock.today).days
+
+    @callback
+    def _async_changed(self) -> None:
+        """Queue a state write after the day changed."""
+        async_get_coalescer(self._hass).async_mark(self)
+
+    @callback
+    def async_write_if_changed(self) -> bool:
+        """Write the state only if it differs from what was last published."""
+        published = (self.native_value,)
+        if published == self._published:
+            return False
+        self._published = published
+        self.async_write_ha_state()
+        return True
 
-        # Start from next month
-        current_date = start_date
-        target_month = current_date.month + interval
-        target_year = current_date.year
 
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
+class ChoreTrackerCountSensorEntity(SensorEntity):
+    """Number of chores, of a hub or overall, that are in one state."""
 
-        # Find the first matching weekday in the selected weeks
-        for week_num in selected_weeks:
-            for weekday in selected_weekdays:
-                candidate_date = self._find_weekday_in_week(
-                    target_year, target_month, weekday, week_num
-                )
-                if candidate_date:
-                    return datetime.combine(candidate_date, datetime.min.time())
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "chores"
+    _attr_icon = "mdi:format-list-checks"
 
-        return None
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        counters: ChoreCounters,
+        chore_state: str,
+        unique_prefix: str,
+        title: str,
+    ) -> None:
+        self._hass = hass
+        self._counters = counters
+        self._chore_state = chore_state
+        self._unique_id = (
+            f"{unique_prefix}_{chore_state.lower().replace(' ', '_')}_count"
+        )
+        self._name = f"{title} {chore_state.lower()}"
+        self._published: tuple[int, dict] | None = None
 
-    def _find_weekday_in_week(
-        self, year: int, month: int, target_weekday: int, week_num: int
-    ) -> date | None:
-        """Find a specific weekday in a specific week of a month."""
-        # Get first day of month
-        first_day = date(year, month, 1)
-        first_weekday = first_day.weekday()
-
-        # Calculate offset to first occurrence of target weekday
-        offset = (target_weekday - first_weekday) % 7
-        first_occurrence = first_day + timedelta(days=offset)
-
-        if week_num == 5:  # "Last" week
-            # Find last occurrence
-            candidate = first_occurrence + timedelta(weeks=3)
-            if candidate.month != month:
-                candidate = first_occurrence + timedelta(weeks=2)
-            return candidate
-        else:
-            # Find nth occurrence
-            candidate = first_occurrence + timedelta(weeks=(week_num - 1))
-            if candidate.month == month:
-                return candidate
+    async def async_added_to_hass(self) -> None:
+        """Follow the counters of the counted state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._counters.async_add_listener(self._chore_state, self._async_changed)
+        )
+        self._published = (self.native_value, self.extra_state_attributes)
 
-        return None
+    @property
+    def unique_id(self) -> str:
+        return self._unique_id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of chores in the state."""
+        return self._counters.count(self._chore_state)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Break the count down by person and area."""
+        return {
+            "per_person": self._counters.per_person(self._chore_state),
+            "per_area": self._counters.per_area(self._chore_state),
+        }
+
+    @callback
+    def _async_changed(self) -> None:
+        """Queue a state write after the counts changed."""
+        async_get_coalescer(self._hass).async_mark(self)
+
+    @callback
+    def async_write_if_changed(self) -> bool:
+        """Write the state only if it differs from what was last published."""
+        published = (self.native_value, self.extra_state_attributes)
+        if published == self._published:
+            return False
+        self._published = published
+        self.async_write_ha_state()
+        return True
@@ -0,0 +1,215 @@
+"""Services for the Chore Tracker integration."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .clock import async_get_clock
+from .due_index import async_get_due_index
+from .history import async_get_history
+
+if TYPE_CHECKING:
+    from .sensor import ChoreTrackerSensorEntity
+
+DOMAIN = "chore_tracker"
+
+SERVICE_COMPLETE_CHORE = "complete_chore"
+SERVICE_SET_DUE_DATE = "set_due_date"
+SERVICE_QUERY_CHORES = "query_chores"
+SERVICE_COMPLETION_HISTORY = "completion_history"
+
+COMPLETE_CHORE_SCHEMA = cv.make_entity_service_schema({})
+SET_DUE_DATE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("due_date"): cv.date,
+    }
+)
+QUERY_CHORES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("overdue", default=False): cv.boolean,
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+        vol.Optional("person"): cv.entity_id,
+        vol.Optional("area"): cv.string,
+    }
+)
+COMPLETION_HISTORY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+    }
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Chore Tracker services once for the whole domain."""
+
+    async def async_handle_complete_chore(call: ServiceCall) -> None:
+        """Handle the complete_chore service call."""
+        entities = _resolve_entities(hass, call)
+        today = async_get_clock(hass).today
+        _LOGGER.debug("Completing %d chores", len(entities))
+        for entity in entities:
+            entity.apply_complete(today)
+        _async_publish(entities)
+
+    async def async_handle_set_due_date(call: ServiceCall) -> None:
+        """Handle the set_due_date service call."""
+        entities = _resolve_entities(hass, call)
+        due_date_input = call.data.get("due_date")
+
+        try:
+            # Handle different input types
+            if isinstance(due_date_input, str):
+                # Parse string to date
+                due_date = datetime.fromisoformat(due_date_input).date()
+            elif isinstance(due_date_input, datetime):
+                # Extract date from datetime
+                due_date = due_date_input.date()
+            else:
+                # Assume it's already a date object
+                due_date = due_date_input
+        except (ValueError, TypeError, AttributeError) as err:
+            _LOGGER.error("Invalid date format: %s", due_date_input)
+            raise ServiceValidationError(
+                f"Invalid date format: {due_date_input}",
+                translation_domain=DOMAIN,
+                translation_key="invalid_date_format",
+            ) from err
+
+        _LOGGER.debug("Setting due date of %d chores to %s", len(entities), due_date)
+        for entity in entities:
+            entity.apply_due_date(due_date)
+        _async_publish(entities)
+
+    async def async_handle_query_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle the query_chores service call."""
+        start = call.data.get("start_date")
+        end = call.data.get("end_date")
+        today = async_get_clock(hass).today
+        overdue = call.data["overdue"]
+        if overdue:
+            # Chores with a due time can already be overdue on their due day
+            start = None
+            end = today
+
+        index: dict[str, ChoreTrackerSensorEntity] = hass.data[DOMAIN]
+        matches = async_get_due_index(hass).async_query(
+            start, end, person=call.data.get("person"), area=call.data.get("area")
+        )
+        if overdue:
+            matches = [
+                (due, entity_id)
+                for due, entity_id in matches
+                if due < today or index[entity_id].state == "Overdue"
+            ]
+        return {
+            "chores": [
+                {
+                    "entity_id": entity_id,
+                    "name": index[entity_id].name,
+                    "state": index[entity_id].state,
+                    "due_date": due.isoformat(),
+                }
+                for due, entity_id in matches
+            ]
+        }
+
+    async def async_handle_completion_history(call: ServiceCall) -> ServiceResponse:
+        """Handle the completion_history service call."""
+        entities = _resolve_entities(hass, call)
+        start = call.data.get("start_date")
+        end = call.data.get("end_date")
+        history = async_get_history(hass)
+
+        chores = {}
+        for entity in entities:
+            completions = await history.async_get_completions(entity.unique_id)
+            chores[entity.entity_id] = [
+                day.isoformat()
+                for day in completions
+                if (start is None or day >= start) and (end is None or day <= end)
+            ]
+        return {"chores": chores}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPLETE_CHORE,
+        async_handle_complete_chore,
+        schema=COMPLETE_CHORE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DUE_DATE,
+        async_handle_set_due_date,
+        schema=SET_DUE_DATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_CHORES,
+        async_handle_query_chores,
+        schema=QUERY_CHORES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPLETION_HISTORY,
+        async_handle_completion_history,
+        schema=COMPLETION_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def _resolve_entities(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[ChoreTrackerSensorEntity]:
+    """Look up every targeted chore, failing before any of them is changed.
+
+    Entities named explicitly must be chores; entities reached through an
+    area, device or label are used when they are chores and skipped otherwise.
+    """
+    index: dict[str, ChoreTrackerSensorEntity] = hass.data[DOMAIN]
+    selected = async_extract_referenced_entity_ids(hass, call)
+
+    missing = sorted(
+        entity_id for entity_id in selected.referenced if entity_id not in index
+    )
+    if missing:
+        _LOGGER.warning("No chore entity found for entity_id=%s", ", ".join(missing))
+        raise ServiceValidationError(
+            f"Entity {', '.join(missing)} not found",
+            translation_domain=DOMAIN,
+            translation_key="entity_not_found",
+        )
+
+    entities = {entity_id: index[entity_id] for entity_id in selected.referenced}
+    for entity_id in selected.indirectly_referenced:
+        if entity_id in index:
+            entities[entity_id] = index[entity_id]
+    return list(entities.values())
+
+
+@callback
+def _async_publish(entities: list[ChoreTrackerSensorEntity]) -> None:
+    """Queue the state write of every changed chore once all are applied."""
+    for entity in entities:
+        entity.async_publish_change()
@@ -0,0 +1,127 @@
+"""Running completion statistics of a chore.
+
+Like recurrence.py this module has no Home Assistant dependencies.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import Any
+
+# Weight of the newest interval in the moving average
+EWMA_ALPHA = 0.3
+
+
+class ChoreStats:
+    """Completion count, on-time streaks, interval EWMA and lateness moments.
+
+    Each completion updates every figure in constant time, so nothing has
+    to be replayed from history. Lateness is the number of days a chore was
+    completed after its due date (negative when early); its mean and
+    variance use Welford's algorithm.
+    """
+
+    __slots__ = (
+        "count",
+        "streak",
+        "best_streak",
+        "interval_ewma",
+        "lateness_count",
+        "lateness_mean",
+        "lateness_m2",
+        "last_completed",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.streak = 0
+        self.best_streak = 0
+        self.interval_ewma: float | None = None
+        self.lateness_count = 0
+        self.lateness_mean = 0.0
+        self.lateness_m2 = 0.0
+        self.last_completed: date | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> ChoreStats:
+        """Restore statistics saved by as_dict()."""
+        stats = cls()
+        if not data:
+            return stats
+        stats.count = data.get("count", 0)
+        stats.streak = data.get("streak", 0)
+        stats.best_streak = data.get("best_streak", 0)
+        stats.interval_ewma = data.get("interval_ewma")
+        stats.lateness_count = data.get("lateness_count", 0)
+        stats.lateness_mean = data.get("lateness_mean", 0.0)
+        stats.lateness_m2 = data.get("lateness_m2", 0.0)
+        if last_completed := data.get("last_completed"):
+            stats.last_completed = date.fromisoformat(last_completed)
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a JSON serialisable form."""
+        return {
+            "count": self.count,
+            "streak": self.streak,
+            "best_streak": self.best_streak,
+            "interval_ewma": self.interval_ewma,
+            "lateness_count": self.lateness_count,
+            "lateness_mean": self.lateness_mean,
+            "lateness_m2": self.lateness_m2,
+            "last_completed": self.last_completed.isoformat()
+            if self.last_completed
+            else None,
+        }
+
+    def record(self, completed_on: date, due: date | None) -> None:
+        """Add a completion of a chore that was due on the given day."""
+        self.count += 1
+
+        if self.last_completed is not None:
+            interval = (completed_on - self.last_completed).days
+            if self.interval_ewma is None:
+                self.interval_ewma = float(interval)
+            else:
+                self.interval_ewma += EWMA_ALPHA * (interval - self.interval_ewma)
+        self.last_completed = completed_on
+
+        if due is None:
+            return
+        lateness = (completed_on - due).days
+        self.lateness_count += 1
+        delta = lateness - self.lateness_mean
+        self.lateness_mean += delta / self.lateness_count
+        self.lateness_m2 += delta * (lateness - self.lateness_mean)
+
+        if lateness <= 0:
+            self.streak += 1
+            self.best_streak = max(self.best_streak, self.streak)
+        else:
+            self.streak = 0
+
+    @property
+    def lateness_variance(self) -> float | None:
+        """Return the sample variance of the lateness."""
+        if self.lateness_count < 2:
+            return None
+        return self.lateness_m2 / (self.lateness_count - 1)
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the statistics as rounded state attributes."""
+        variance = self.lateness_variance
+        return {
+            "completion_count": self.count,
+            "current_streak": self.streak,
+            "best_streak": self.best_streak,
+            "average_interval_days": round(self.interval_ewma, 1)
+            if self.interval_ewma is not None
+            else None,
+            "average_lateness_days": round(self.lateness_mean, 1)
+            if self.lateness_count
+            else None,
+            "lateness_stddev_days": round(math.sqrt(variance), 1)
+            if variance is not None
+            else None,
+        }
@@ -0,0 +1,127 @@
+"""Persistent chore state for Chore Tracker."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util.uuid import random_uuid_hex
+
+DOMAIN = "chore_tracker"
+DATA_STORE = f"{DOMAIN}_store"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = DOMAIN
+# Seconds to wait for more changes before writing to disk
+SAVE_DELAY = 10
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_store(hass: HomeAssistant) -> ChoreStore:
+    """Return the store loaded by async_setup."""
+    return hass.data[DATA_STORE]
+
+
+class ChoreStore:
+    """Due dates, completions and overrides of every chore, keyed by chore id.
+
+    Also holds the chore definitions of hub entries, keyed by hub entry id
+    and then chore id. The whole file is read once at setup. Changes are
+    written back after SAVE_DELAY seconds, so a burst of completions costs a
+    single write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._chores: dict[str, dict[str, Any]] = {}
+        self._hubs: dict[str, dict[str, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Read the stored chores from disk."""
+        data = await self._store.async_load() or {}
+        self._chores = data.get("chores", {})
+        self._hubs = data.get("hubs", {})
+        _LOGGER.debug(
+            "Loaded state for %d chores and %d hubs", len(self._chores), len(self._hubs)
+        )
+
+    @callback
+    def async_get(self, chore_id: str) -> dict[str, Any] | None:
+        """Return the stored record of a chore."""
+        return self._chores.get(chore_id)
+
+    @callback
+    def async_update(
+        self,
+        chore_id: str,
+        due_date: date | None,
+        last_completed_date: date | None,
+        due_date_overridden: bool,
+        stats: dict[str, Any] | None = None,
+    ) -> None:
+        """Record the state of a chore and schedule a save."""
+        self._chores[chore_id] = {
+            "due_date": due_date.isoformat() if due_date else None,
+            "last_completed_date": last_completed_date.isoformat()
+            if last_completed_date
+            else None,
+            "due_date_overridden": due_date_overridden,
+            "stats": stats,
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_clear_due_date(self, chore_id: str) -> None:
+        """Drop a chore's due date so it is rescheduled from its definition.
+
+        A due date set by hand is kept; it was not derived from the old
+        definition.
+        """
+        record = self._chores.get(chore_id)
+        if record is None or record.get("due_date_overridden"):
+            return
+        record["due_date"] = None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, chore_id: str) -> None:
+        """Forget a chore and schedule a save."""
+        if self._chores.pop(chore_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_get_hub_chores(self, hub_id: str) -> dict[str, dict[str, Any]]:
+        """Return the chore definitions of a hub, keyed by chore id."""
+        return self._hubs.get(hub_id, {})
+
+    @callback
+    def async_add_hub_chore(self, hub_id: str, definition: dict[str, Any]) -> str:
+        """Add a chore definition to a hub and return its new chore id."""
+        chore_id = random_uuid_hex()
+        self._hubs.setdefault(hub_id, {})[chore_id] = definition
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return chore_id
+
+    @callback
+    def async_remove_hub_chore(self, hub_id: str, chore_id: str) -> None:
+        """Remove a chore definition and its state from a hub."""
+        self._hubs.get(hub_id, {}).pop(chore_id, None)
+        self._chores.pop(chore_id, None)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove_hub(self, hub_id: str) -> None:
+        """Forget a hub together with all of its chores."""
+        for chore_id in self._hubs.pop(hub_id, {}):
+            self._chores.pop(chore_id, None)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to disk."""
+        return {"chores": self._chores, "hubs": self._hubs}
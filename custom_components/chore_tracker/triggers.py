@@ -0,0 +1,113 @@
+"""Delivery of chore transitions to device triggers and the event bus."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+DOMAIN = "chore_tracker"
+DATA_TRIGGERS = f"{DOMAIN}_triggers"
+
+EVENT_CHORE_COMPLETED = f"{DOMAIN}_completed"
+EVENT_CHORE_TRANSITION = f"{DOMAIN}_transition"
+
+TRIGGER_BECAME_DUE = "became_due"
+TRIGGER_BECAME_OVERDUE = "became_overdue"
+TRIGGER_COMPLETED = "completed"
+TRIGGER_TYPES = (TRIGGER_BECAME_DUE, TRIGGER_BECAME_OVERDUE, TRIGGER_COMPLETED)
+
+# Published chore states that fire a trigger when a chore enters them
+STATE_TRIGGERS = {
+    "Due today": TRIGGER_BECAME_DUE,
+    "Due now": TRIGGER_BECAME_DUE,
+    "Overdue": TRIGGER_BECAME_OVERDUE,
+}
+
+
+@callback
+def async_get_trigger_index(hass: HomeAssistant) -> TransitionTriggers:
+    """Return the domain-wide trigger index, creating it on first use."""
+    triggers = hass.data.get(DATA_TRIGGERS)
+    if triggers is None:
+        triggers = hass.data[DATA_TRIGGERS] = TransitionTriggers(hass)
+    return triggers
+
+
+class TransitionTriggers:
+    """Attached triggers indexed by (chore id, trigger type), plus event batches.
+
+    A transition only reaches the triggers attached to that chore and type,
+    and costs a single dict lookup when nothing is listening. Events are
+    collected until the end of the loop iteration and fired as one event per
+    type listing every chore, so a midnight rollover fires a single
+    chore_tracker_transition event.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._subscribers: dict[
+            tuple[str, str], list[Callable[[dict[str, Any]], None]]
+        ] = {}
+        self._pending_events: dict[str, list[dict[str, Any]]] = {}
+
+    @callback
+    def async_subscribe(
+        self,
+        chore_id: str,
+        trigger_type: str,
+        subscriber: Callable[[dict[str, Any]], None],
+    ) -> CALLBACK_TYPE:
+        """Call subscriber with the transition data whenever it happens."""
+        key = (chore_id, trigger_type)
+        self._subscribers.setdefault(key, []).append(subscriber)
+
+        @callback
+        def unsubscribe() -> None:
+            subscribers = self._subscribers[key]
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._subscribers[key]
+
+        return unsubscribe
+
+    @callback
+    def async_transition(self, chore_id: str, data: dict[str, Any]) -> None:
+        """Announce that a chore's written state changed."""
+        if (trigger_type := STATE_TRIGGERS.get(data["to_state"])) is not None:
+            self._async_run(chore_id, trigger_type, data)
+        self._async_queue_event(EVENT_CHORE_TRANSITION, chore_id, data)
+
+    @callback
+    def async_completed(self, chore_id: str, data: dict[str, Any]) -> None:
+        """Announce that a chore was completed."""
+        self._async_run(chore_id, TRIGGER_COMPLETED, data)
+        self._async_queue_event(EVENT_CHORE_COMPLETED, chore_id, data)
+
+    @callback
+    def _async_run(
+        self, chore_id: str, trigger_type: str, data: dict[str, Any]
+    ) -> None:
+        """Run the triggers attached to a chore transition."""
+        for subscriber in self._subscribers.get((chore_id, trigger_type), ()):
+            subscriber(data)
+
+    @callback
+    def _async_queue_event(
+        self, event_type: str, chore_id: str, data: dict[str, Any]
+    ) -> None:
+        """Add a chore to the batch fired at the end of the loop iteration."""
+        if not self._pending_events:
+            self._hass.loop.call_soon(self._async_fire_events)
+        self._pending_events.setdefault(event_type, []).append(
+            {"chore_id": chore_id, **data}
+        )
+
+    @callback
+    def _async_fire_events(self) -> None:
+        """Fire one event per type for every queued chore."""
+        pending = self._pending_events
+        self._pending_events = {}
+        for event_type, chores in pending.items():
+            self._hass.bus.async_fire(event_type, {"chores": chores})